@@ -0,0 +1,512 @@
+"""
+Redis-backed caching for expensive backend calls.
+
+Provides a CacheManager with namespaced keys, per-namespace TTLs, and a
+cache_result decorator for async functions.
+"""
+import asyncio
+import hashlib
+import struct
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+import redis.asyncio as redis
+from loguru import logger
+
+from .config.settings import settings
+
+# orjson serializes and parses the cached payloads (Pinecone matches,
+# LLM responses — long strings) several times faster than stdlib json;
+# fall back to stdlib when the package is missing. Both paths produce
+# and consume bytes, so the Redis client runs with decode_responses off.
+try:
+    import orjson
+
+    def _dumps(value: Any) -> bytes:
+        return orjson.dumps(value)
+
+    def _loads(raw: bytes) -> Any:
+        return orjson.loads(raw)
+except ImportError:
+    import json
+
+    def _dumps(value: Any) -> bytes:
+        return json.dumps(value).encode()
+
+    def _loads(raw: bytes) -> Any:
+        return json.loads(raw)
+
+
+class CacheError(Exception):
+    """Custom exception for cache errors."""
+    pass
+
+
+def _encode(value: Any) -> bytes:
+    """
+    Encode a value with a one-byte type tag.
+
+    bytes and str payloads (embedding blobs, raw text) are stored as-is
+    behind an "R"/"S" tag instead of being base64-wrapped inside JSON,
+    which would inflate them ~33% and force a parse on every read;
+    everything else is JSON behind a "J" tag.
+    """
+    if isinstance(value, (bytes, bytearray)):
+        return b"R" + bytes(value)
+    if isinstance(value, str):
+        return b"S" + value.encode()
+    return b"J" + _dumps(value)
+
+
+def _decode(raw: bytes) -> Any:
+    """Decode a type-tagged payload."""
+    tag, payload = raw[:1], raw[1:]
+    if tag == b"R":
+        return payload
+    if tag == b"S":
+        return payload.decode()
+    return _loads(payload)
+
+
+# Default TTLs per cache namespace (seconds)
+CACHE_CONFIG: Dict[str, int] = {
+    "company_api": 30,
+    "pinecone": 300,
+    "github": 3600,
+    "llm": 600,
+}
+
+_DEFAULT_TTL = 300
+
+# Payloads above this size are parsed in a worker thread: multi-ms JSON
+# decodes on the event loop stall every connection's audio path.
+_LARGE_PAYLOAD_BYTES = 16 * 1024
+
+
+async def _decode_maybe_offloaded(raw: bytes) -> Any:
+    """Decode a payload, using the default executor when it is large."""
+    if len(raw) > _LARGE_PAYLOAD_BYTES:
+        return await asyncio.get_running_loop().run_in_executor(
+            None, _decode, raw
+        )
+    return _decode(raw)
+
+
+def _stable_bytes(value: Any) -> bytes:
+    """Stable byte representation of a value for key hashing."""
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, str):
+        return value.encode()
+    if isinstance(value, bool) or value is None:
+        return str(value).encode()
+    if isinstance(value, int):
+        return value.to_bytes((value.bit_length() + 8) // 8, "little", signed=True)
+    if isinstance(value, float):
+        return struct.pack("<d", value)
+    return repr(value).encode()
+
+
+def _hash_call(func_name: str, args: tuple, kwargs: dict) -> str:
+    """
+    Digest a function call into a compact cache key.
+
+    Feeds each argument to BLAKE2b incrementally instead of building one
+    large f-string of reprs; BLAKE2b is also faster per byte than MD5.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(func_name.encode())
+    for a in args:
+        h.update(b"\x00")
+        h.update(_stable_bytes(a))
+    for k in sorted(kwargs):
+        h.update(b"\x01")
+        h.update(k.encode())
+        h.update(_stable_bytes(kwargs[k]))
+    return h.hexdigest()
+
+
+class CacheManager:
+    """
+    Async Redis cache with namespaced keys.
+
+    Keys follow the ``jarvis:{namespace}:{key}`` convention; values are
+    serialized to bytes. All operations degrade gracefully: a Redis
+    failure logs a warning and behaves like a cache miss rather than
+    breaking the caller.
+    """
+
+    def __init__(self, url: Optional[str] = None):
+        """
+        Initialize the cache manager.
+
+        Args:
+            url: Redis connection URL (defaults to settings.REDIS_URL)
+        """
+        self.url = url or settings.REDIS_URL or "redis://localhost:6379/0"
+        self._client: Optional[redis.Redis] = None
+        self._connect_lock: Optional[asyncio.Lock] = None
+
+        # Process-local L1 in front of Redis: repeated hot keys (the same
+        # load status queried through a conversation) skip the network
+        # round-trip and deserialization entirely. Entries carry their
+        # own monotonic expiry; LRU order is maintained via move_to_end.
+        self._l1: "OrderedDict[str, tuple]" = OrderedDict()
+        self._l1_maxsize = 1024
+
+        # In-flight map for cache_result: concurrent identical calls on a
+        # cold key share one downstream call via a common Future.
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        # Background write tasks kept strongly referenced until done, so
+        # fire-and-forget sets aren't garbage-collected mid-flight and
+        # can be drained on disconnect.
+        self._bg_tasks: set = set()
+
+        # Interned "jarvis:{namespace}:" prefixes; key building is one
+        # dict hit plus a concat instead of a three-field f-string per
+        # cache operation. Known namespaces are prepopulated.
+        self._ns_prefix: Dict[str, str] = {
+            ns: f"jarvis:{ns}:" for ns in CACHE_CONFIG
+        }
+
+        logger.info("Cache manager initialized")
+
+    def _l1_get(self, cache_key: str) -> Optional[Any]:
+        """Get a live value from the L1 tier, refreshing its LRU slot."""
+        entry = self._l1.get(cache_key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._l1[cache_key]
+            return None
+        self._l1.move_to_end(cache_key)
+        return value
+
+    def _l1_set(self, cache_key: str, value: Any, ttl_seconds: int) -> None:
+        """Store a value in the L1 tier, evicting the LRU entry if full."""
+        self._l1[cache_key] = (time.monotonic() + ttl_seconds, value)
+        self._l1.move_to_end(cache_key)
+        if len(self._l1) > self._l1_maxsize:
+            self._l1.popitem(last=False)
+
+    async def connect(self) -> None:
+        """
+        Connect to Redis (idempotent, safe under concurrency).
+
+        Two coroutines racing through startup previously each built a
+        client, leaking the loser's pool; the lock makes the second
+        caller reuse the first one's client. The pool is sized explicitly
+        and health-checked so idle connections killed by NAT timeouts
+        don't stall a cache read later.
+        """
+        if self._client is not None:
+            return
+
+        # Created lazily so the manager can be constructed outside a loop
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+
+        async with self._connect_lock:
+            if self._client is not None:
+                return
+            pool = redis.ConnectionPool.from_url(
+                self.url,
+                max_connections=32,
+                socket_keepalive=True,
+                decode_responses=False,
+            )
+            self._client = redis.Redis(
+                connection_pool=pool,
+                health_check_interval=30,
+            )
+            logger.info(f"Connected to Redis at {self.url}")
+
+    async def _ensure_connected(self) -> None:
+        """Lazily establish the Redis client before an operation."""
+        if self._client is None:
+            await self.connect()
+
+    def _set_in_background(
+        self,
+        key: str,
+        value: Any,
+        namespace: str,
+        ttl_seconds: Optional[int],
+    ) -> None:
+        """
+        Schedule a cache write without blocking the caller.
+
+        The Redis round-trip is pure overhead on the caller's latency;
+        the write completes in the background while the result is
+        already on its way back.
+        """
+        task = asyncio.create_task(self.set(key, value, namespace, ttl_seconds))
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+
+    async def disconnect(self) -> None:
+        """Close the Redis connection after draining pending writes."""
+        if self._bg_tasks:
+            await asyncio.gather(*self._bg_tasks, return_exceptions=True)
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            logger.info("Disconnected from Redis")
+
+    def _make_key(self, namespace: str, key: str) -> str:
+        """Build the namespaced Redis key."""
+        prefix = self._ns_prefix.get(namespace)
+        if prefix is None:
+            prefix = self._ns_prefix[namespace] = f"jarvis:{namespace}:"
+        return prefix + key
+
+    async def get(self, key: str, namespace: str = "default") -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key within the namespace
+            namespace: Cache namespace
+
+        Returns:
+            The cached value, or None on miss
+        """
+        cache_key = self._make_key(namespace, key)
+
+        value = self._l1_get(cache_key)
+        if value is not None:
+            return value
+
+        await self._ensure_connected()
+        try:
+            raw = await self._client.get(cache_key)
+        except Exception as e:
+            logger.warning(f"Cache get failed for {cache_key}: {e}")
+            return None
+
+        if raw is None:
+            return None
+
+        value = await _decode_maybe_offloaded(raw)
+        self._l1_set(cache_key, value, CACHE_CONFIG.get(namespace, _DEFAULT_TTL))
+        return value
+
+    async def mget(
+        self,
+        keys: List[str],
+        namespace: str = "default",
+    ) -> List[Optional[Any]]:
+        """
+        Get several cached values in one round-trip.
+
+        L1 hits are served locally; the remaining keys go to Redis as a
+        single MGET instead of one GET round-trip each.
+
+        Args:
+            keys: Cache keys within the namespace
+            namespace: Cache namespace
+
+        Returns:
+            Values aligned with keys; None for misses
+        """
+        cache_keys = [self._make_key(namespace, k) for k in keys]
+        results: List[Optional[Any]] = [self._l1_get(ck) for ck in cache_keys]
+
+        missing = [i for i, v in enumerate(results) if v is None]
+        if not missing:
+            return results
+
+        await self._ensure_connected()
+        try:
+            raws = await self._client.mget([cache_keys[i] for i in missing])
+        except Exception as e:
+            logger.warning(f"Cache mget failed: {e}")
+            return results
+
+        ttl = CACHE_CONFIG.get(namespace, _DEFAULT_TTL)
+        for i, raw in zip(missing, raws):
+            if raw is None:
+                continue
+            value = await _decode_maybe_offloaded(raw)
+            results[i] = value
+            self._l1_set(cache_keys[i], value, ttl)
+
+        return results
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        namespace: str = "default",
+        ttl_seconds: Optional[int] = None,
+    ) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key: Cache key within the namespace
+            value: JSON-serializable value to store
+            namespace: Cache namespace
+            ttl_seconds: TTL override (defaults to the namespace TTL)
+        """
+        if ttl_seconds is None:
+            ttl_seconds = CACHE_CONFIG.get(namespace, _DEFAULT_TTL)
+
+        cache_key = self._make_key(namespace, key)
+        self._l1_set(cache_key, value, ttl_seconds)
+
+        await self._ensure_connected()
+        try:
+            await self._client.set(cache_key, _encode(value), ex=ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Cache set failed for {cache_key}: {e}")
+
+    async def delete(self, key: str, namespace: str = "default") -> None:
+        """
+        Delete a cached value.
+
+        Args:
+            key: Cache key within the namespace
+            namespace: Cache namespace
+        """
+        cache_key = self._make_key(namespace, key)
+        self._l1.pop(cache_key, None)
+
+        await self._ensure_connected()
+        try:
+            await self._client.delete(cache_key)
+        except Exception as e:
+            logger.warning(f"Cache delete failed for {cache_key}: {e}")
+
+    async def exists(self, key: str, namespace: str = "default") -> bool:
+        """
+        Check whether a key is cached.
+
+        Args:
+            key: Cache key within the namespace
+            namespace: Cache namespace
+
+        Returns:
+            bool: True if the key exists
+        """
+        cache_key = self._make_key(namespace, key)
+        await self._ensure_connected()
+        try:
+            return bool(await self._client.exists(cache_key))
+        except Exception as e:
+            logger.warning(f"Cache exists failed for {cache_key}: {e}")
+            return False
+
+    async def clear_namespace(self, namespace: str) -> int:
+        """
+        Delete every key in a namespace.
+
+        Args:
+            namespace: Cache namespace to clear
+
+        Returns:
+            int: Number of keys deleted
+        """
+        prefix = self._make_key(namespace, "")
+        for ck in [k for k in self._l1 if k.startswith(prefix)]:
+            del self._l1[ck]
+
+        await self._ensure_connected()
+
+        # Large SCAN batches cut cursor round-trips; UNLINK reclaims the
+        # values asynchronously on the Redis side instead of blocking its
+        # event loop like DEL would. Deleting in 500-key pipeline flushes
+        # keeps Python-side memory bounded regardless of namespace size.
+        pattern = self._make_key(namespace, "*")
+        deleted = 0
+        batch: List[bytes] = []
+        try:
+            async for key in self._client.scan_iter(match=pattern, count=1000):
+                batch.append(key)
+                if len(batch) >= 500:
+                    pipe = self._client.pipeline(transaction=False)
+                    pipe.unlink(*batch)
+                    await pipe.execute()
+                    deleted += len(batch)
+                    batch.clear()
+            if batch:
+                pipe = self._client.pipeline(transaction=False)
+                pipe.unlink(*batch)
+                await pipe.execute()
+                deleted += len(batch)
+        except Exception as e:
+            logger.warning(f"Cache clear failed for namespace {namespace}: {e}")
+            return deleted
+
+        logger.info(f"Cleared {deleted} keys from namespace {namespace}")
+        return deleted
+
+    def cache_result(
+        self,
+        namespace: str = "default",
+        ttl_seconds: Optional[int] = None,
+    ) -> Callable:
+        """
+        Decorator caching an async function's result.
+
+        The cache key is derived from the function name and arguments.
+
+        Args:
+            namespace: Cache namespace for the function's results
+            ttl_seconds: TTL override (defaults to the namespace TTL)
+
+        Returns:
+            Callable: Decorator for async functions
+
+        Example:
+            >>> cache = CacheManager()
+            >>> @cache.cache_result(namespace="company_api")
+            ... async def get_load_status(load_id: str):
+            ...     ...
+        """
+        def decorator(func: Callable) -> Callable:
+            async def wrapper(*args, **kwargs):
+                cache_key = _hash_call(func.__qualname__, args, kwargs)
+
+                cached = await self.get(cache_key, namespace)
+                if cached is not None:
+                    logger.debug(f"Cache hit: {func.__name__}")
+                    return cached
+
+                # Single-flight: a concurrent identical call already in
+                # progress is awaited instead of re-running the backend
+                inflight = self._inflight.get(cache_key)
+                if inflight is not None:
+                    return await asyncio.shield(inflight)
+
+                fut: asyncio.Future = asyncio.get_running_loop().create_future()
+                self._inflight[cache_key] = fut
+                try:
+                    result = await func(*args, **kwargs)
+                    if not fut.done():
+                        fut.set_result(result)
+                except BaseException as e:
+                    if not fut.done():
+                        fut.set_exception(e)
+                        # Mark retrieved so a miss with no waiters
+                        # doesn't warn; waiters still see the raise.
+                        fut.exception()
+                    raise
+                finally:
+                    self._inflight.pop(cache_key, None)
+
+                self._set_in_background(cache_key, result, namespace, ttl_seconds)
+                return result
+
+            wrapper.__name__ = func.__name__
+            wrapper.__doc__ = func.__doc__
+            return wrapper
+
+        return decorator
+
+
+# Shared cache manager instance
+cache_manager = CacheManager()
@@ -0,0 +1,678 @@
+"""
+Latency tracking for the voice pipeline.
+
+Provides LatencyMetrics for per-operation latency statistics and a
+PerformanceMonitor that times operations against the end-to-end latency
+targets (STT, LLM, TTS, and full voice-to-voice round trip).
+"""
+import heapq
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+from loguru import logger
+
+from .config.settings import settings
+
+# Latency targets per operation (milliseconds)
+LATENCY_TARGETS: Dict[str, float] = {
+    "stt": 300.0,
+    "llm_first_token": 500.0,
+    "tts_first_byte": 300.0,
+    "voice_to_voice": 1500.0,
+}
+
+
+class StreamingPercentile:
+    """
+    Dual-heap running percentile with O(log N) insert, O(1) read.
+
+    Values at or below the tracked percentile sit in a max-heap (stored
+    negated in a heapq min-heap); values above it sit in a min-heap.
+    After each insert the boundary is rebalanced so the low heap holds
+    exactly the target fraction of samples, making the percentile the
+    low heap's root with no sorting at read time. Suited to unbounded
+    sessions where retaining every raw sample is not acceptable.
+    """
+
+    def __init__(self, target: float = 0.9):
+        """
+        Initialize the estimator.
+
+        Args:
+            target: Percentile to track as a fraction (e.g. 0.9 for p90)
+        """
+        if not 0.0 < target < 1.0:
+            raise ValueError(f"target must be in (0, 1), got {target}")
+        self.target = target
+        self._lo: list = []  # negated max-heap of values <= percentile
+        self._hi: list = []  # min-heap of values > percentile
+
+    @property
+    def count(self) -> int:
+        """Number of inserted samples."""
+        return len(self._lo) + len(self._hi)
+
+    def insert(self, x: float) -> None:
+        """
+        Insert one sample.
+
+        Args:
+            x: Sample value
+        """
+        if self._lo and x > -self._lo[0]:
+            heapq.heappush(self._hi, x)
+        else:
+            heapq.heappush(self._lo, -x)
+
+        # Rebalance so the low heap holds the target fraction (at least
+        # one element once any sample exists)
+        want_lo = max(1, int(self.target * self.count))
+        while len(self._lo) > want_lo:
+            heapq.heappush(self._hi, -heapq.heappop(self._lo))
+        while len(self._lo) < want_lo:
+            heapq.heappush(self._lo, -heapq.heappop(self._hi))
+
+    def value(self) -> float:
+        """Current percentile estimate (0.0 before any insert)."""
+        return -self._lo[0] if self._lo else 0.0
+
+
+class ApproxLatencyHistogram:
+    """
+    Fixed-memory approximate percentiles over log-spaced buckets.
+
+    Latencies are counted into buckets whose edges grow geometrically
+    between 0.1 ms and 60 s, giving a bounded relative error per bucket
+    (~2% at 240 buckets) with a few KB of memory regardless of sample
+    volume — the HDR-histogram trade-off without an extra dependency.
+    Inserts are one binary search; percentiles walk the cumulative
+    counts.
+    """
+
+    def __init__(self, min_ms: float = 0.1, max_ms: float = 60_000.0,
+                 buckets: int = 240):
+        """
+        Initialize the histogram.
+
+        Args:
+            min_ms: Lower bound of the bucketed range (values clamp)
+            max_ms: Upper bound of the bucketed range (values clamp)
+            buckets: Number of log-spaced buckets
+        """
+        self._edges = np.geomspace(min_ms, max_ms, buckets + 1)
+        self._counts = np.zeros(buckets, dtype=np.int64)
+        self._total = 0
+
+    @property
+    def count(self) -> int:
+        """Number of recorded samples."""
+        return self._total
+
+    def record(self, latency_ms: float) -> None:
+        """
+        Count one latency sample into its bucket.
+
+        Args:
+            latency_ms: Measured latency in milliseconds
+        """
+        idx = int(np.searchsorted(self._edges, latency_ms, side="right")) - 1
+        if idx < 0:
+            idx = 0
+        elif idx >= self._counts.shape[0]:
+            idx = self._counts.shape[0] - 1
+        self._counts[idx] += 1
+        self._total += 1
+
+    def percentile(self, p: float) -> float:
+        """
+        Approximate percentile as the upper edge of the matching bucket.
+
+        Args:
+            p: Percentile in [0, 100]
+
+        Returns:
+            float: Approximate latency in milliseconds (0.0 when empty)
+        """
+        if not self._total:
+            return 0.0
+        rank = p / 100.0 * self._total
+        cumulative = np.cumsum(self._counts)
+        idx = int(np.searchsorted(cumulative, rank, side="left"))
+        return float(self._edges[idx + 1])
+
+
+@dataclass
+class LatencyMetrics:
+    """Latency statistics for a single tracked operation."""
+
+    operation: str
+
+    # Retention window: only the most recent window_size samples are
+    # kept, so memory and sort cost stay bounded in long sessions and
+    # percentiles reflect recent performance rather than all history.
+    window_size: int = 10_000
+
+    # Samples live in a growable float64 numpy buffer: 8 B per sample
+    # instead of ~28 B boxed PyFloats, and sorting/reductions run in C
+    # over the unboxed array rather than through Timsort on objects.
+    # Once the window fills, the buffer becomes a ring and the write
+    # index wraps over the oldest sample.
+    _buf: np.ndarray = field(
+        default_factory=lambda: np.empty(1024, dtype=np.float64),
+        repr=False, compare=False,
+    )
+    _n: int = field(default=0, repr=False, compare=False)
+    _write: int = field(default=0, repr=False, compare=False)
+
+    # Sorted-snapshot cache: dashboards poll percentiles far more often
+    # than new samples arrive, so the sort is redone only after an insert
+    _sorted: Optional[np.ndarray] = field(
+        default=None, repr=False, compare=False
+    )
+    _dirty: bool = field(default=True, repr=False, compare=False)
+
+    # Running aggregates maintained on insert, so mean/min/max reads are
+    # O(1) instead of a reduction over the whole window. When a window
+    # eviction removes the current extreme the flag forces one rescan on
+    # the next read.
+    _sum: float = field(default=0.0, repr=False, compare=False)
+    _run_min: float = field(default=float("inf"), repr=False, compare=False)
+    _run_max: float = field(default=float("-inf"), repr=False, compare=False)
+    _extrema_stale: bool = field(default=False, repr=False, compare=False)
+
+    # Rank indices for median/p90/p95/p99, recomputed only when the
+    # sample count changes (never once the window is full) instead of on
+    # every stats read.
+    _rank_idx: tuple = field(default=(0, 0, 0, 0), repr=False, compare=False)
+
+    @property
+    def latencies(self) -> np.ndarray:
+        """View of the recorded samples."""
+        return self._buf[:self._n]
+
+    def _ensure_capacity(self, needed: int) -> None:
+        """Grow the buffer geometrically, capped at the window size."""
+        capacity = self._buf.shape[0]
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        capacity = min(capacity, self.window_size)
+        grown = np.empty(capacity, dtype=np.float64)
+        grown[:self._n] = self._buf[:self._n]
+        self._buf = grown
+
+    def add_measurement(self, latency_ms: float) -> None:
+        """
+        Record one latency sample, evicting the oldest when full.
+
+        Args:
+            latency_ms: Measured latency in milliseconds
+        """
+        if self._n < self.window_size:
+            self._ensure_capacity(self._n + 1)
+            self._n += 1
+            self._sum += latency_ms
+            self._update_rank_idx()
+        else:
+            evicted = float(self._buf[self._write])
+            self._sum += latency_ms - evicted
+            if evicted <= self._run_min or evicted >= self._run_max:
+                self._extrema_stale = True
+        self._buf[self._write] = latency_ms
+        self._write = (self._write + 1) % self.window_size
+        if latency_ms < self._run_min:
+            self._run_min = latency_ms
+        if latency_ms > self._run_max:
+            self._run_max = latency_ms
+        self._dirty = True
+
+    def _update_rank_idx(self) -> None:
+        """Recompute the median/p90/p95/p99 rank indices for the count."""
+        n = self._n
+        self._rank_idx = (
+            n // 2,
+            min(int(n * 0.90), n - 1),
+            min(int(n * 0.95), n - 1),
+            min(int(n * 0.99), n - 1),
+        )
+
+    def add_measurements(self, latencies_ms) -> None:
+        """
+        Record a batch of latency samples in bulk numpy operations.
+
+        Slice assignments and vectorized sums replace per-sample Python
+        calls, so ingesting a replayed trace or a flushed side buffer
+        costs a few array operations rather than len(batch) method calls.
+
+        Args:
+            latencies_ms: Iterable of measured latencies in milliseconds
+        """
+        xs = np.asarray(latencies_ms, dtype=np.float64).ravel()
+        k = xs.size
+        if not k:
+            return
+        if k >= self.window_size:
+            # Only the newest window_size samples can survive; drop the
+            # rest before touching the buffer.
+            xs = xs[-self.window_size:]
+            k = xs.size
+
+        # Fill any remaining window headroom contiguously first.
+        fill = min(k, self.window_size - self._n)
+        if fill:
+            self._ensure_capacity(self._n + fill)
+            self._buf[self._n:self._n + fill] = xs[:fill]
+            self._sum += float(xs[:fill].sum())
+            self._n += fill
+            self._write = self._n % self.window_size
+
+        # Overwrite the oldest samples with the remainder, wrapping at
+        # the window edge (at most two slice assignments).
+        rest = xs[fill:]
+        if rest.size:
+            split = self.window_size - self._write
+            for chunk in (rest[:split], rest[split:]):
+                m = chunk.size
+                if not m:
+                    continue
+                evicted = self._buf[self._write:self._write + m]
+                self._sum += float(chunk.sum()) - float(evicted.sum())
+                self._buf[self._write:self._write + m] = chunk
+                self._write = (self._write + m) % self.window_size
+            self._extrema_stale = True
+
+        self._run_min = min(self._run_min, float(xs.min()))
+        self._run_max = max(self._run_max, float(xs.max()))
+        self._update_rank_idx()
+        self._dirty = True
+
+    def _get_sorted(self) -> np.ndarray:
+        """Sorted samples, rebuilt only after new measurements."""
+        if self._dirty or self._sorted is None:
+            self._sorted = np.sort(self._buf[:self._n])
+            self._dirty = False
+        return self._sorted
+
+    @property
+    def count(self) -> int:
+        """Number of recorded samples."""
+        return self._n
+
+    def _refresh_extrema(self) -> None:
+        """Rescan the window after an eviction displaced an extreme."""
+        window = self._buf[:self._n]
+        self._run_min = float(window.min())
+        self._run_max = float(window.max())
+        self._extrema_stale = False
+
+    @property
+    def mean(self) -> float:
+        """Mean latency in milliseconds."""
+        return self._sum / self._n if self._n else 0.0
+
+    @property
+    def median(self) -> float:
+        """
+        Median latency in milliseconds.
+
+        Nearest-rank (element at n // 2), not the interpolated
+        two-element average: for latency reporting an actual observed
+        sample is as meaningful and skips the extra arithmetic and
+        even/odd branch.
+        """
+        return self._rank_value(0)
+
+    @property
+    def min(self) -> float:
+        """Minimum latency in milliseconds."""
+        if not self._n:
+            return 0.0
+        if self._extrema_stale:
+            self._refresh_extrema()
+        return self._run_min
+
+    @property
+    def max(self) -> float:
+        """Maximum latency in milliseconds."""
+        if not self._n:
+            return 0.0
+        if self._extrema_stale:
+            self._refresh_extrema()
+        return self._run_max
+
+    def _rank_value(self, slot: int) -> float:
+        """Sample at one of the precomputed rank indices."""
+        if not self._n:
+            return 0.0
+        return float(self._get_sorted()[self._rank_idx[slot]])
+
+    @property
+    def p90(self) -> float:
+        """90th percentile latency in milliseconds."""
+        return self._rank_value(1)
+
+    @property
+    def p95(self) -> float:
+        """95th percentile latency in milliseconds."""
+        return self._rank_value(2)
+
+    @property
+    def p99(self) -> float:
+        """99th percentile latency in milliseconds."""
+        return self._rank_value(3)
+
+    def _compute_stats(self) -> Dict[str, float]:
+        """
+        Compute all order statistics in one pass over the window.
+
+        Uses an already-clean sorted snapshot when one exists; otherwise
+        np.partition places just the four needed ranks in O(N) instead of
+        an O(N log N) full sort. Tiny windows fall back to the full sort,
+        where partition's overhead outweighs its asymptotics.
+        """
+        n = self._n
+        idxs = self._rank_idx
+        if (not self._dirty and self._sorted is not None) or n < 32:
+            s = self._get_sorted()
+        else:
+            s = np.partition(self._buf[:n], idxs)
+        if self._extrema_stale:
+            self._refresh_extrema()
+        return {
+            "mean_ms": self._sum / n,
+            "median_ms": float(s[idxs[0]]),
+            "min_ms": self._run_min,
+            "max_ms": self._run_max,
+            "p90_ms": float(s[idxs[1]]),
+            "p95_ms": float(s[idxs[2]]),
+            "p99_ms": float(s[idxs[3]]),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the metrics to a report dict."""
+        if not self._n:
+            return {
+                "operation": self.operation,
+                "count": 0,
+                "window_size": self.window_size,
+                "mean_ms": 0.0,
+                "median_ms": 0.0,
+                "min_ms": 0.0,
+                "max_ms": 0.0,
+                "p90_ms": 0.0,
+                "p95_ms": 0.0,
+                "p99_ms": 0.0,
+            }
+
+        stats = self._compute_stats()
+        stats.update({
+            "operation": self.operation,
+            "count": self.count,
+            "window_size": self.window_size,
+        })
+        return stats
+
+
+class _TrackContext:
+    """Async context manager that times one operation for a monitor."""
+
+    __slots__ = ("_monitor", "_operation", "_metrics", "_start")
+
+    def __init__(self, monitor: "PerformanceMonitor", operation: str):
+        self._monitor = monitor
+        self._operation = operation
+
+    async def __aenter__(self) -> None:
+        # Resolve the metrics object before the clock starts so dict
+        # lookup/creation never lands inside the measured window.
+        self._metrics = self._monitor._get_or_create(self._operation)
+        self._start = time.perf_counter_ns()
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        latency_ms = (time.perf_counter_ns() - self._start) * 1e-6
+        self._metrics.add_measurement(latency_ms)
+        if self._monitor._debug_enabled:
+            logger.debug(f"{self._operation}: {latency_ms:.2f}ms")
+        return False
+
+
+class _NullTrackContext:
+    """Shared no-op stand-in for _TrackContext when tracking is disabled."""
+
+    __slots__ = ()
+
+    async def __aenter__(self) -> None:
+        return None
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NOOP_TRACK = _NullTrackContext()
+
+
+class PerformanceMonitor:
+    """
+    Central latency monitor for pipeline operations.
+
+    Operations are timed with the track() context manager or the
+    track_async()/track_sync() decorators; results accumulate in one
+    LatencyMetrics per operation name.
+
+    Storage is sharded by thread id: track_sync runs inside executor
+    threads, and giving each thread its own shard keeps the write path
+    lock-free. Readers merge the shards on demand.
+    """
+
+    NUM_SHARDS = 8
+
+    def __init__(self, enabled: bool = True):
+        """
+        Initialize the monitor.
+
+        Args:
+            enabled: Whether tracking is active
+        """
+        self._enabled = enabled
+        # Per-measurement debug lines format an f-string on every sample;
+        # only pay for that when running in debug mode.
+        self._debug_enabled = settings.DEBUG
+        self._shards: list = [{} for _ in range(self.NUM_SHARDS)]
+        logger.info("Performance monitor initialized")
+
+    def enable(self) -> None:
+        """Enable tracking."""
+        self._enabled = True
+
+    def disable(self) -> None:
+        """Disable tracking."""
+        self._enabled = False
+
+    def _get_or_create(self, operation: str) -> LatencyMetrics:
+        """Fetch the calling thread's metrics for an operation."""
+        shard = self._shards[threading.get_ident() % self.NUM_SHARDS]
+        metrics = shard.get(operation)
+        if metrics is None:
+            metrics = shard.setdefault(
+                operation, LatencyMetrics(operation=operation)
+            )
+        return metrics
+
+    def _merged(self, operation: str) -> Optional[LatencyMetrics]:
+        """Merge an operation's per-shard metrics into one view."""
+        parts = [
+            metrics
+            for shard in self._shards
+            if (metrics := shard.get(operation)) is not None and metrics.count
+        ]
+        if not parts:
+            return None
+        if len(parts) == 1:
+            return parts[0]
+        merged = LatencyMetrics(operation=operation)
+        for metrics in parts:
+            merged.add_measurements(metrics.latencies)
+        return merged
+
+    def _record(self, operation: str, latency_ms: float) -> None:
+        """Store one measurement for an operation."""
+        self._get_or_create(operation).add_measurement(latency_ms)
+        if self._debug_enabled:
+            logger.debug(f"{operation}: {latency_ms:.2f}ms")
+
+    def track(self, operation: str) -> "_TrackContext":
+        """
+        Async context manager timing one operation.
+
+        When the monitor is disabled this returns a shared do-nothing
+        context manager, so disabled tracking costs one attribute check
+        instead of a generator frame per call.
+
+        Args:
+            operation: Operation name (e.g. "stt", "llm_first_token")
+
+        Example:
+            >>> async with monitor.track("llm_first_token"):
+            ...     await llm.generate(...)
+        """
+        if not self._enabled:
+            return _NOOP_TRACK
+        return _TrackContext(self, operation)
+
+    def track_async(self, operation: str) -> Callable:
+        """
+        Decorator timing an async function.
+
+        Args:
+            operation: Operation name for the metrics
+
+        Returns:
+            Callable: Decorator for async functions
+        """
+        def decorator(func: Callable) -> Callable:
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                if not self._enabled:
+                    return await func(*args, **kwargs)
+                metrics = self._get_or_create(operation)
+                start_time = time.perf_counter_ns()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    latency_ms = (time.perf_counter_ns() - start_time) * 1e-6
+                    metrics.add_measurement(latency_ms)
+                    if self._debug_enabled:
+                        logger.debug(f"{operation}: {latency_ms:.2f}ms")
+            return wrapper
+        return decorator
+
+    def track_sync(self, operation: str) -> Callable:
+        """
+        Decorator timing a sync function.
+
+        Args:
+            operation: Operation name for the metrics
+
+        Returns:
+            Callable: Decorator for sync functions
+        """
+        def decorator(func: Callable) -> Callable:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self._enabled:
+                    return func(*args, **kwargs)
+                metrics = self._get_or_create(operation)
+                start_time = time.perf_counter_ns()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    latency_ms = (time.perf_counter_ns() - start_time) * 1e-6
+                    metrics.add_measurement(latency_ms)
+                    if self._debug_enabled:
+                        logger.debug(f"{operation}: {latency_ms:.2f}ms")
+            return wrapper
+        return decorator
+
+    def get_metrics(self, operation: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the metrics report for one operation.
+
+        Args:
+            operation: Tracked operation name
+
+        Returns:
+            Metrics dict, or None if the operation was never tracked
+        """
+        metrics = self._merged(operation)
+        return metrics.to_dict() if metrics is not None else None
+
+    def get_summary(self) -> Dict[str, Dict[str, Any]]:
+        """Get merged metrics reports for every tracked operation."""
+        operations: set = set()
+        for shard in self._shards:
+            operations.update(shard)
+        return {
+            operation: merged.to_dict()
+            for operation in sorted(operations)
+            if (merged := self._merged(operation)) is not None
+        }
+
+    def log_summary(self) -> None:
+        """Log a latency summary for every tracked operation."""
+        summary = self.get_summary()
+        if not summary:
+            logger.info("No performance metrics recorded")
+            return
+
+        logger.info("===== Performance Summary =====")
+        for operation, metrics in summary.items():
+            # One sink call per operation instead of nine: each logger
+            # call pays record construction and handler dispatch.
+            logger.info(
+                f"  {operation}: count={metrics['count']} "
+                f"mean={metrics['mean_ms']:.2f}ms "
+                f"median={metrics['median_ms']:.2f}ms "
+                f"p90={metrics['p90_ms']:.2f}ms "
+                f"p95={metrics['p95_ms']:.2f}ms "
+                f"p99={metrics['p99_ms']:.2f}ms "
+                f"min={metrics['min_ms']:.2f}ms "
+                f"max={metrics['max_ms']:.2f}ms"
+            )
+
+    def check_targets(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Compare tracked operations against their latency targets.
+
+        Returns:
+            Per-operation dict with the target, actual p90, and pass/fail
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        for operation, target_ms in LATENCY_TARGETS.items():
+            # One to_dict() snapshot per operation: every stat comes from
+            # the same single sorted pass instead of separate property
+            # reads.
+            report = self.get_metrics(operation)
+            if report is None or not report["count"]:
+                continue
+            actual_p90 = report["p90_ms"]
+            results[operation] = {
+                "target_ms": target_ms,
+                "actual_p90_ms": actual_p90,
+                "met": actual_p90 <= target_ms,
+            }
+        return results
+
+    def reset(self) -> None:
+        """Clear all recorded metrics."""
+        for shard in self._shards:
+            shard.clear()
+        logger.info("Performance metrics reset")
+
+
+# Shared monitor instance
+performance_monitor = PerformanceMonitor()
@@ -0,0 +1,71 @@
+"""FastAPI server exposing the Jarvis voice pipeline over WebSocket."""
+import asyncio
+
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from loguru import logger
+
+from .pipeline import JarvisPipeline
+from .transports import WebSocketTransport
+from .config.settings import settings
+
+app = FastAPI(title="Jarvis Voice Assistant")
+
+
+@app.get("/health")
+async def health():
+    """Simple liveness check."""
+    return {"status": "ok"}
+
+
+@app.websocket("/ws")
+async def websocket_endpoint(websocket: WebSocket):
+    """
+    Voice session endpoint.
+
+    The browser streams raw PCM audio (s16le) as binary messages;
+    synthesized speech is streamed back the same way.
+    """
+    await websocket.accept()
+    logger.info("WebSocket connection accepted")
+
+    pipeline = JarvisPipeline()
+    transport = WebSocketTransport(websocket)
+
+    try:
+        await pipeline.setup(transport)
+        await transport.start(pipeline._task)
+
+        pipeline_run = asyncio.create_task(pipeline.run())
+
+        while True:
+            audio_data = await websocket.receive_bytes()
+            await transport.send_audio(audio_data)
+
+    except WebSocketDisconnect:
+        logger.info("WebSocket client disconnected")
+    except Exception as e:
+        logger.error(f"WebSocket session error: {e}")
+    finally:
+        await transport.stop()
+        await pipeline.stop()
+
+
+def main():
+    """Run the server with uvicorn."""
+    import uvicorn
+
+    uvicorn.run(
+        app,
+        host=settings.BACKEND_HOST,
+        port=settings.BACKEND_PORT,
+        # PCM audio is incompressible; permessage-deflate only burns CPU
+        # per frame and adds send-side latency, so it stays off. Inbound
+        # messages are 20 ms audio chunks, so 1 MiB is generous headroom
+        # while still bounding a misbehaving client.
+        ws_per_message_deflate=False,
+        ws_max_size=1024 * 1024,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -154,29 +154,50 @@ class OpenAILLMService:
             logger.error(f"Error processing messages: {e}")
             raise
 
-    async def generate_response(self, user_message: str) -> str:
+    async def stream_response(self, user_message: str) -> AsyncIterator[str]:
         """
-        Generate a single response to a user message.
+        Stream response tokens for a user message as they arrive.
+
+        Yields each text chunk as soon as the LLM produces it, so consumers
+        (WebSocket/SSE handlers) can flush per-token instead of waiting for
+        the full completion. Conversation history is updated with the
+        complete response once the stream ends.
 
         Args:
             user_message: User's input text
 
-        Returns:
-            str: Assistant's response text
+        Yields:
+            str: Incremental response text chunks
         """
         self.add_user_message(user_message)
 
-        response_text = ""
+        chunks: List[str] = []
         async for frame in self.process_messages():
             # Handle both TextFrame and LLMTextFrame
             if isinstance(frame, (TextFrame, LLMTextFrame)):
-                response_text += frame.text
+                if frame.text:
+                    chunks.append(frame.text)
+                    yield frame.text
             elif isinstance(frame, LLMFullResponseEndFrame):
                 # End of response
                 break
 
-        self.add_assistant_message(response_text)
-        return response_text
+        self.add_assistant_message("".join(chunks))
+
+    async def generate_response(self, user_message: str) -> str:
+        """
+        Generate a single response to a user message.
+
+        Convenience wrapper around stream_response() that joins the
+        streamed chunks only at the end.
+
+        Args:
+            user_message: User's input text
+
+        Returns:
+            str: Assistant's response text
+        """
+        return "".join([c async for c in self.stream_response(user_message)])
 
     def clear_history(self, keep_system_prompt: bool = True):
         """
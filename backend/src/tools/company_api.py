@@ -5,8 +5,10 @@ Provides functions to interact with the company's internal API
 for loads, inventory, and equipment tracking with source attribution.
 """
 
+import asyncio
 import os
-from typing import Dict, Any, Optional, List
+import threading
+from typing import Dict, Any, Optional, List, Tuple
 import httpx
 from loguru import logger
 
@@ -16,6 +18,70 @@ class CompanyAPIError(Exception):
     pass
 
 
+# Per-endpoint source attribution templates. The static fields never change,
+# so each getter shallow-copies its template and fills in only the
+# call-specific keys instead of rebuilding the whole dict per request.
+_SOURCE_TEMPLATES: Dict[str, Dict[str, str]] = {
+    "load": {"type": "company_api", "system": "warehouse_management_system"},
+    "inventory": {"type": "company_api", "system": "inventory_management_system"},
+    "equipment": {"type": "company_api", "system": "equipment_tracking_system"},
+}
+
+# Cap on concurrent upstream API calls. Agents fanning out many tool calls
+# in parallel would otherwise overrun the upstream rate limit and exhaust
+# sockets; requests beyond the cap block until a slot frees up.
+_DEFAULT_CONCURRENCY_LIMIT = 20
+_api_semaphore = threading.BoundedSemaphore(_DEFAULT_CONCURRENCY_LIMIT)
+
+# Shared HTTP client: reusing one connection pool across calls (and the
+# worker threads of get_company_data_batch — httpx.Client is thread-safe)
+# pays the TCP/TLS handshake once per upstream host instead of per call.
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    """
+    Get the shared httpx.Client, creating it on first use.
+
+    Returns:
+        httpx.Client: Lazily-constructed shared client
+    """
+    global _http_client
+
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(
+                    timeout=10.0,
+                    limits=httpx.Limits(
+                        max_connections=_DEFAULT_CONCURRENCY_LIMIT,
+                        max_keepalive_connections=_DEFAULT_CONCURRENCY_LIMIT,
+                        keepalive_expiry=90,
+                    ),
+                )
+    return _http_client
+
+
+def set_concurrency_limit(limit: int) -> None:
+    """
+    Set the maximum number of concurrent Company API requests.
+
+    Args:
+        limit: Maximum in-flight requests (must be >= 1)
+
+    Raises:
+        ValueError: If limit is less than 1
+    """
+    global _api_semaphore
+
+    if limit < 1:
+        raise ValueError(f"Concurrency limit must be >= 1, got {limit}")
+
+    _api_semaphore = threading.BoundedSemaphore(limit)
+    logger.info(f"Company API concurrency limit set to {limit}")
+
+
 def get_api_config() -> Dict[str, str]:
     """
     Get Company API configuration from environment.
@@ -70,12 +136,13 @@ def _make_request(
 
         logger.debug(f"Company API request: {method} {url}")
 
-        with httpx.Client(timeout=timeout) as client:
-            response = client.request(
+        with _api_semaphore:
+            response = _get_client().request(
                 method=method,
                 url=url,
                 params=params,
-                headers=headers
+                headers=headers,
+                timeout=timeout
             )
 
             response.raise_for_status()
@@ -128,13 +195,13 @@ def get_load_status(load_id: str) -> Dict[str, Any]:
     data = _make_request(endpoint)
 
     # Add enhanced source attribution
-    data["source"] = {
-        "type": "company_api",
-        "system": data.get("source", "warehouse_management_system"),
-        "endpoint": endpoint,
-        "load_id": load_id,
-        "last_updated": data.get("last_updated"),
-    }
+    src = _SOURCE_TEMPLATES["load"].copy()
+    if "source" in data:
+        src["system"] = data["source"]
+    src["endpoint"] = endpoint
+    src["load_id"] = load_id
+    src["last_updated"] = data.get("last_updated")
+    data["source"] = src
 
     logger.info(f"Retrieved load status for {load_id}: {data.get('status')}")
     return data
@@ -162,12 +229,12 @@ def list_loads() -> Dict[str, Any]:
     data = _make_request(endpoint)
 
     # Add enhanced source attribution
-    data["source"] = {
-        "type": "company_api",
-        "system": data.get("source", "warehouse_management_system"),
-        "endpoint": endpoint,
-        "total_count": data.get("total_count", 0),
-    }
+    src = _SOURCE_TEMPLATES["load"].copy()
+    if "source" in data:
+        src["system"] = data["source"]
+    src["endpoint"] = endpoint
+    src["total_count"] = data.get("total_count", 0)
+    data["source"] = src
 
     logger.info(f"Retrieved {data.get('total_count', 0)} loads")
     return data
@@ -206,13 +273,13 @@ def get_inventory(sku: str) -> Dict[str, Any]:
     data = _make_request(endpoint)
 
     # Add enhanced source attribution
-    data["source"] = {
-        "type": "company_api",
-        "system": data.get("source", "inventory_management_system"),
-        "endpoint": endpoint,
-        "sku": sku,
-        "last_updated": data.get("last_updated"),
-    }
+    src = _SOURCE_TEMPLATES["inventory"].copy()
+    if "source" in data:
+        src["system"] = data["source"]
+    src["endpoint"] = endpoint
+    src["sku"] = sku
+    src["last_updated"] = data.get("last_updated")
+    data["source"] = src
 
     logger.info(f"Retrieved inventory for {sku}: {data.get('quantity')} units")
     return data
@@ -248,12 +315,12 @@ def list_inventory() -> Dict[str, Any]:
         enriched_items.append(item)
 
     data["items"] = enriched_items
-    data["source"] = {
-        "type": "company_api",
-        "system": data.get("source", "inventory_management_system"),
-        "endpoint": endpoint,
-        "total_items": data.get("total_items", 0),
-    }
+    src = _SOURCE_TEMPLATES["inventory"].copy()
+    if "source" in data:
+        src["system"] = data["source"]
+    src["endpoint"] = endpoint
+    src["total_items"] = data.get("total_items", 0)
+    data["source"] = src
 
     logger.info(f"Retrieved {data.get('total_items', 0)} inventory items")
     return data
@@ -292,13 +359,13 @@ def get_equipment_status(equipment_id: str) -> Dict[str, Any]:
     data = _make_request(endpoint)
 
     # Add enhanced source attribution
-    data["source"] = {
-        "type": "company_api",
-        "system": data.get("source", "equipment_tracking_system"),
-        "endpoint": endpoint,
-        "equipment_id": equipment_id,
-        "last_updated": data.get("last_updated"),
-    }
+    src = _SOURCE_TEMPLATES["equipment"].copy()
+    if "source" in data:
+        src["system"] = data["source"]
+    src["endpoint"] = endpoint
+    src["equipment_id"] = equipment_id
+    src["last_updated"] = data.get("last_updated")
+    data["source"] = src
 
     logger.info(f"Retrieved equipment status for {equipment_id}: {data.get('status')}")
     return data
@@ -327,12 +394,12 @@ def list_equipment() -> Dict[str, Any]:
     data = _make_request(endpoint)
 
     # Add enhanced source attribution
-    data["source"] = {
-        "type": "company_api",
-        "system": data.get("source", "equipment_tracking_system"),
-        "endpoint": endpoint,
-        "total_count": data.get("total_count", 0),
-    }
+    src = _SOURCE_TEMPLATES["equipment"].copy()
+    if "source" in data:
+        src["system"] = data["source"]
+    src["endpoint"] = endpoint
+    src["total_count"] = data.get("total_count", 0)
+    data["source"] = src
 
     logger.info(f"Retrieved {data.get('total_count', 0)} equipment items")
     return data
@@ -364,28 +431,61 @@ def get_company_data(
         >>> # Get all inventory
         >>> inventory = get_company_data("inventory")
     """
-    data_type = data_type.lower()
-
-    if data_type == "load":
-        if identifier:
-            return get_load_status(identifier)
-        else:
-            return list_loads()
-
-    elif data_type == "inventory":
-        if identifier:
-            return get_inventory(identifier)
-        else:
-            return list_inventory()
-
-    elif data_type == "equipment":
-        if identifier:
-            return get_equipment_status(identifier)
-        else:
-            return list_equipment()
-
-    else:
+    try:
+        single, listing = _DISPATCH[data_type.lower()]
+    except KeyError:
         raise CompanyAPIError(
             f"Invalid data_type: {data_type}. "
             f"Must be one of: load, inventory, equipment"
         )
+
+    return single(identifier) if identifier else listing()
+
+
+# Dispatch table for get_company_data: data_type -> (single-item getter,
+# listing getter). A single dict lookup replaces the if/elif chain on the
+# hot agent entrypoint.
+_DISPATCH = {
+    "load": (get_load_status, list_loads),
+    "inventory": (get_inventory, list_inventory),
+    "equipment": (get_equipment_status, list_equipment),
+}
+
+
+async def get_company_data_batch(
+    requests: List[Tuple[str, Optional[str]]],
+) -> List[Dict[str, Any]]:
+    """
+    Fetch multiple pieces of company data concurrently.
+
+    Runs each request in a worker thread under the shared concurrency
+    limit, so callers can fan out (e.g. list all loads, then check each
+    load's status) without overrunning the upstream API. A failure in any
+    request cancels the remaining ones.
+
+    Args:
+        requests: List of (data_type, identifier) pairs as accepted by
+            get_company_data
+
+    Returns:
+        List of result dictionaries in the same order as the requests
+
+    Raises:
+        CompanyAPIError: If any request fails
+
+    Example:
+        >>> results = await get_company_data_batch([
+        ...     ("load", "2314"),
+        ...     ("load", "2315"),
+        ...     ("inventory", None),
+        ... ])
+    """
+    async with asyncio.TaskGroup() as tg:
+        tasks = [
+            tg.create_task(
+                asyncio.to_thread(get_company_data, data_type, identifier)
+            )
+            for data_type, identifier in requests
+        ]
+
+    return [task.result() for task in tasks]
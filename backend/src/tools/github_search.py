@@ -5,20 +5,537 @@ Provides code search capabilities using GitHub API
 with proper source attribution for all results.
 """
 
+import asyncio
+import base64
+import codecs
+import functools
+import hashlib
+import itertools
 import os
-from typing import List, Dict, Any, Optional
+import random
+import shelve
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Tuple
 import httpx
+from cachetools import LRUCache, TTLCache
 from loguru import logger
 
+# orjson parses GitHub's nested search payloads several times faster
+# than stdlib json; fall back to stdlib when the extra isn't installed.
+try:
+    import orjson
+
+    def _json_loads(raw: bytes) -> Any:
+        return orjson.loads(raw)
+except ImportError:
+    import json
+
+    def _json_loads(raw: bytes) -> Any:
+        return json.loads(raw)
+
 
 class GitHubSearchError(Exception):
     """Custom exception for GitHub search errors."""
     pass
 
 
+# Result-item containers. Slotted dataclasses avoid the per-item __dict__
+# and the dozens of throwaway dict allocations the old formatting loop
+# made per page; instances serialize back to plain dicts only at the
+# return boundary so the public result shape is unchanged.
+@dataclass(slots=True)
+class RepositoryInfo:
+    """Repository fields attached to a code search item."""
+    id: Optional[int] = None
+    name: Optional[str] = None
+    full_name: Optional[str] = None
+    owner: Optional[str] = None
+    html_url: Optional[str] = None
+    description: Optional[str] = None
+    private: bool = False
+
+
+@dataclass(slots=True)
+class SourceAttribution:
+    """Source attribution fields for a code search item."""
+    repository: Optional[str] = None
+    file_path: Optional[str] = None
+    html_url: Optional[str] = None
+    sha: Optional[str] = None
+    api_url: Optional[str] = None
+    type: str = "github"
+    platform: str = "GitHub Code Search"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to the public source dict shape."""
+        return {
+            "type": self.type,
+            "platform": self.platform,
+            "repository": self.repository,
+            "file_path": self.file_path,
+            "html_url": self.html_url,
+            "sha": self.sha,
+            "api_url": self.api_url,
+        }
+
+
+@dataclass(slots=True)
+class CodeSearchItem:
+    """One formatted code search result."""
+    name: Optional[str] = None
+    path: Optional[str] = None
+    sha: Optional[str] = None
+    url: Optional[str] = None
+    git_url: Optional[str] = None
+    html_url: Optional[str] = None
+    repository: RepositoryInfo = field(default_factory=RepositoryInfo)
+    score: Optional[float] = None
+    source: SourceAttribution = field(default_factory=SourceAttribution)
+    text_matches: Optional[List[Dict[str, Any]]] = None
+
+    @classmethod
+    def from_api_item(cls, item: Dict[str, Any]) -> "CodeSearchItem":
+        """Build an item from a raw GitHub API search result."""
+        get = item.get
+        repo_dict = get("repository") or {}
+        repo_get = repo_dict.get
+        path = get("path")
+        sha = get("sha")
+        url = get("url")
+        html_url = get("html_url")
+        full_name = repo_get("full_name")
+
+        matches = get("text_matches")
+        text_matches = None
+        if matches is not None:
+            # Bind match.get once per match instead of five lookups each
+            text_matches = [
+                {
+                    "object_url": mget("object_url"),
+                    "object_type": mget("object_type"),
+                    "property": mget("property"),
+                    "fragment": mget("fragment"),
+                    "matches": mget("matches", []),
+                }
+                for match in matches
+                for mget in (match.get,)
+            ]
+
+        return cls(
+            name=get("name"),
+            path=path,
+            sha=sha,
+            url=url,
+            git_url=get("git_url"),
+            html_url=html_url,
+            repository=RepositoryInfo(
+                id=repo_get("id"),
+                name=repo_get("name"),
+                full_name=full_name,
+                owner=(repo_get("owner") or {}).get("login"),
+                html_url=repo_get("html_url"),
+                description=repo_get("description"),
+                private=repo_get("private", False),
+            ),
+            score=get("score"),
+            source=SourceAttribution(
+                repository=full_name,
+                file_path=path,
+                html_url=html_url,
+                sha=sha,
+                api_url=url,
+            ),
+            text_matches=text_matches,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to the public item dict shape."""
+        repo = self.repository
+        out = {
+            "name": self.name,
+            "path": self.path,
+            "sha": self.sha,
+            "url": self.url,
+            "git_url": self.git_url,
+            "html_url": self.html_url,
+            "repository": {
+                "id": repo.id,
+                "name": repo.name,
+                "full_name": repo.full_name,
+                "owner": repo.owner,
+                "html_url": repo.html_url,
+                "description": repo.description,
+                "private": repo.private,
+            },
+            "score": self.score,
+            "source": self.source.to_dict(),
+        }
+        if self.text_matches is not None:
+            out["text_matches"] = self.text_matches
+        return out
+
+
+# Shared async HTTP client. Creating a client per call forces a fresh
+# TCP+TLS handshake on every request; a persistent client reuses pooled
+# connections and lets concurrent searches fan out. HTTP/2 multiplexes
+# concurrent requests as streams over a single connection (GitHub
+# supports H2), so the pool stays small instead of opening dozens of
+# parallel sockets. The client is bound to the event loop it was created
+# in, so it is rebuilt if callers switch loops (e.g. successive
+# asyncio.run invocations from the sync wrappers).
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """
+    Get the shared httpx.AsyncClient for the running event loop.
+
+    Returns:
+        httpx.AsyncClient: Lazily-constructed shared client
+    """
+    global _client, _client_loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        try:
+            _client = httpx.AsyncClient(
+                http2=True,
+                timeout=15.0,
+                limits=httpx.Limits(
+                    max_connections=8,
+                    max_keepalive_connections=8,
+                    keepalive_expiry=90,
+                ),
+            )
+        except ImportError:
+            # h2 extra not installed; HTTP/1.1 needs a wider pool to get
+            # the same request concurrency.
+            _client = httpx.AsyncClient(
+                timeout=15.0,
+                limits=httpx.Limits(
+                    max_connections=64,
+                    max_keepalive_connections=32,
+                ),
+            )
+        _client_loop = loop
+
+    return _client
+
+
+async def aclose_client() -> None:
+    """Close the shared HTTP client. Call on application shutdown."""
+    global _client, _client_loop
+
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        _client_loop = None
+
+
+class GitHubRateLimiter:
+    """
+    Client-side pacing for GitHub API requests.
+
+    GitHub enforces separate limits per resource: 30 requests/minute for
+    code search and 5000 requests/hour for core endpoints (file contents).
+    Rather than discovering the limit through 403 responses after the
+    fact, each bucket keeps a sliding window of recent request timestamps
+    and honors the server's X-RateLimit-* headers, delaying requests
+    before they are sent.
+    """
+
+    def __init__(self):
+        """Initialize one bucket per GitHub rate-limit resource."""
+        self._buckets: Dict[str, Dict[str, Any]] = {
+            "search": {
+                "window": 60.0,
+                "max_requests": 30,
+                "timestamps": deque(),
+                "next_allowed": 0.0,
+            },
+            "core": {
+                "window": 3600.0,
+                "max_requests": 5000,
+                "timestamps": deque(),
+                "next_allowed": 0.0,
+            },
+        }
+
+    async def acquire(self, endpoint: str = "core") -> None:
+        """
+        Wait until a request to the given endpoint bucket is permitted.
+
+        Args:
+            endpoint: Bucket name ("search" or "core")
+        """
+        bucket = self._buckets.get(endpoint, self._buckets["core"])
+        timestamps = bucket["timestamps"]
+
+        while True:
+            now = time.monotonic()
+
+            # Drop timestamps that fell out of the sliding window
+            while timestamps and now - timestamps[0] > bucket["window"]:
+                timestamps.popleft()
+
+            if bucket["next_allowed"] > now:
+                wait = bucket["next_allowed"] - now
+            elif len(timestamps) >= bucket["max_requests"]:
+                wait = bucket["window"] - (now - timestamps[0])
+            else:
+                timestamps.append(now)
+                return
+
+            logger.debug(
+                f"GitHub rate limiter pacing '{endpoint}' requests, "
+                f"waiting {wait:.1f}s"
+            )
+            await asyncio.sleep(wait)
+
+    def update_from_headers(self, endpoint: str, headers: Any) -> None:
+        """
+        Record the server's rate-limit state from response headers.
+
+        When X-RateLimit-Remaining hits zero, subsequent acquire() calls
+        block until the advertised reset time.
+
+        Args:
+            endpoint: Bucket name the response belongs to
+            headers: Response headers from the GitHub API
+        """
+        bucket = self._buckets.get(endpoint, self._buckets["core"])
+
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+
+        if remaining == "0" and reset:
+            try:
+                delay = max(0.0, int(reset) - time.time())
+            except ValueError:
+                return
+            bucket["next_allowed"] = time.monotonic() + delay
+            logger.warning(
+                f"GitHub '{endpoint}' rate limit exhausted; "
+                f"pausing requests for {delay:.0f}s"
+            )
+
+
+_rate_limiter = GitHubRateLimiter()
+
+# Result caches. Agents tend to repeat identical searches and file
+# fetches; serving repeats from memory saves an HTTPS round-trip and a
+# rate-limit token. Search results age out after an hour. File content
+# gets a two-level cache: a short TTL keyed by (owner, repo, path, ref)
+# for repeated lookups, plus a never-expiring LRU for fetches pinned to
+# a full commit SHA, whose content is immutable.
+_search_cache: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+_file_cache: TTLCache = TTLCache(maxsize=256, ttl=300)
+_blob_cache: LRUCache = LRUCache(maxsize=512)
+
+# In-flight request tracking. When identical requests arrive while one is
+# already on the wire (parallel agent tool calls), later callers await the
+# first request's future instead of issuing a duplicate upstream hit.
+# Entries are removed as soon as the request settles, so the dicts stay
+# empty between bursts.
+_search_inflight: Dict[Any, asyncio.Future] = {}
+_file_inflight: Dict[Any, asyncio.Future] = {}
+
+
+def _search_cache_key(
+    full_query: str, sort: str, order: str, max_results: int, per_page: int
+) -> str:
+    """Build a stable cache key for a code search request."""
+    # per_page belongs in the key: it is sent to the API and can cap the
+    # returned items below max_results, so results fetched with a small
+    # page must not satisfy callers asking for a larger one.
+    raw = f"{full_query}:{sort}:{order}:{max_results}:{per_page}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def _is_full_sha(ref: Optional[str]) -> bool:
+    """True when ref is a full 40-hex SHA, i.e. an immutable pin."""
+    if ref is None or len(ref) != 40:
+        return False
+    try:
+        int(ref, 16)
+    except ValueError:
+        return False
+    return True
+
+
+class ETagStore:
+    """
+    ETag + body store for conditional GitHub requests.
+
+    GitHub answers If-None-Match with 304 Not Modified without charging
+    the primary rate limit, so replaying a stored ETag makes unchanged
+    queries and files effectively free. Entries are persisted via shelve
+    so the benefit survives restarts; if the shelf cannot be opened the
+    store degrades to in-memory only.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the store.
+
+        Args:
+            path: Shelf file path (default: ~/.cache/jarvis/github_etags)
+        """
+        self._path = path or os.path.join(
+            os.path.expanduser("~"), ".cache", "jarvis", "github_etags"
+        )
+        self._mem: Dict[str, Any] = {}
+        self._shelf = None
+        self._shelf_failed = False
+
+    def _get_shelf(self):
+        """Lazily open the shelf, falling back to memory-only on failure."""
+        if self._shelf is None and not self._shelf_failed:
+            try:
+                os.makedirs(os.path.dirname(self._path), exist_ok=True)
+                self._shelf = shelve.open(self._path)
+            except Exception as e:
+                logger.debug(f"ETag store persistence unavailable: {e}")
+                self._shelf_failed = True
+        return self._shelf
+
+    def get(self, key: str) -> Optional[tuple]:
+        """Return the stored (etag, body) pair for key, if any."""
+        entry = self._mem.get(key)
+        if entry is not None:
+            return entry
+
+        shelf = self._get_shelf()
+        if shelf is not None:
+            entry = shelf.get(key)
+            if entry is not None:
+                self._mem[key] = entry
+        return entry
+
+    def set(self, key: str, etag: str, body: Any) -> None:
+        """Store the (etag, body) pair for key."""
+        entry = (etag, body)
+        self._mem[key] = entry
+
+        shelf = self._get_shelf()
+        if shelf is not None:
+            try:
+                shelf[key] = entry
+                shelf.sync()
+            except Exception as e:
+                logger.debug(f"Failed to persist ETag entry: {e}")
+
+
+_etag_store = ETagStore()
+
+
+def _etag_key(url: str, params: Optional[Dict[str, Any]]) -> str:
+    """Build a stable ETag-store key for a (url, params) pair."""
+    raw = f"{url}?{sorted((params or {}).items())}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+# Statuses worth a client-side retry: rate limiting (403 with the
+# X-RateLimit headers, 429) and transient upstream errors.
+_RETRYABLE_STATUSES = frozenset({403, 429, 502, 503, 504})
+
+
+def _backoff_delay(attempt: int, initial: float = 0.5, cap: float = 30.0) -> float:
+    """Exponential backoff with full jitter for the given attempt number."""
+    return random.uniform(0, min(cap, initial * (2 ** attempt)))
+
+
+async def _rate_limited_get(
+    bucket: str,
+    url: str,
+    params: Optional[Dict[str, Any]],
+    headers: Dict[str, str],
+    max_attempts: int = 5,
+) -> httpx.Response:
+    """
+    Issue a GET through the shared client under the rate limiter.
+
+    Transient failures (429, 502, 503, 504, transport errors) are retried
+    with exponential backoff plus jitter; a Retry-After header, when
+    present, is honored exactly. The final response (success or not) is
+    returned for the caller's own status handling.
+
+    Args:
+        bucket: Rate-limit bucket name ("search" or "core")
+        url: Request URL
+        params: Query parameters
+        headers: Request headers
+        max_attempts: Maximum request attempts
+
+    Returns:
+        httpx.Response: The last response received
+
+    Raises:
+        httpx.TransportError: If every attempt fails at the transport level
+    """
+    client = _get_client()
+    response = None
+
+    for attempt in range(max_attempts):
+        await _rate_limiter.acquire(bucket)
+        try:
+            response = await client.get(url, params=params, headers=headers)
+        except httpx.TransportError as e:
+            if attempt == max_attempts - 1:
+                raise
+            wait = _backoff_delay(attempt)
+            logger.warning(
+                f"GitHub transport error on attempt {attempt + 1}/{max_attempts} "
+                f"({e}), retrying in {wait:.1f}s"
+            )
+            await asyncio.sleep(wait)
+            continue
+
+        _rate_limiter.update_from_headers(bucket, response.headers)
+        status = response.status_code
+
+        if (
+            status not in _RETRYABLE_STATUSES
+            or attempt == max_attempts - 1
+        ):
+            return response
+
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            wait = float(retry_after)
+        elif status == 403 and response.headers.get("X-RateLimit-Remaining") != "0":
+            # 403 for reasons other than rate limiting (e.g. auth)
+            return response
+        else:
+            wait = _backoff_delay(attempt)
+
+        logger.warning(
+            f"GitHub {status} on attempt {attempt + 1}/{max_attempts}, "
+            f"retrying in {wait:.1f}s"
+        )
+        await asyncio.sleep(wait)
+
+    return response
+
+
+# Headers common to every GitHub request; per-request copies add only
+# Authorization and If-None-Match on top.
+_BASE_HEADERS = {
+    "Accept": "application/vnd.github.v3+json",
+    "User-Agent": "Jarvis-Voice-Assistant",
+}
+
+
+@functools.cache
 def get_github_token() -> Optional[str]:
     """
-    Get GitHub API token from environment.
+    Get GitHub API token from environment (memoized).
+
+    The env lookup and the missing-token warning run once per process
+    instead of on every request.
 
     Returns:
         GitHub token or None if not set
@@ -39,7 +556,16 @@ def get_github_token() -> Optional[str]:
     return token
 
 
-def search_github_code(
+def _request_headers() -> Dict[str, str]:
+    """Build request headers from the shared base plus auth if available."""
+    headers = dict(_BASE_HEADERS)
+    token = get_github_token()
+    if token:
+        headers["Authorization"] = f"token {token}"
+    return headers
+
+
+async def search_github_code_async(
     query: str,
     max_results: int = 5,
     sort: str = "indexed",
@@ -51,10 +577,16 @@ def search_github_code(
     user: Optional[str] = None,
     path: Optional[str] = None,
     extension: Optional[str] = None,
+    skip_cache: bool = False,
 ) -> Dict[str, Any]:
     """
     Search for code on GitHub using the GitHub API.
 
+    Async variant using the shared HTTP client, so concurrent searches
+    reuse pooled connections instead of paying a TLS handshake per call.
+    Results are cached for an hour; pass skip_cache=True to force a
+    fresh request.
+
     Args:
         query: Search query string
         max_results: Maximum number of results to return (default: 5)
@@ -102,35 +634,101 @@ def search_github_code(
         ...     print(f"Repo: {item['repository']['full_name']}")
         ...     print(f"URL: {item['html_url']}")
     """
+    full_query = _build_full_query(
+        query,
+        language=language,
+        repo=repo,
+        org=org,
+        user=user,
+        path=path,
+        extension=extension,
+    )
+
+    cache_key = _search_cache_key(full_query, sort, order, max_results, per_page)
+    if not skip_cache:
+        cached = _search_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"GitHub search cache hit: {full_query}")
+            return cached
+
+    # Coalesce concurrent identical searches into one upstream request;
+    # the cache key already covers every request parameter.
+    sig = cache_key
+    inflight = _search_inflight.get(sig)
+    if inflight is not None:
+        logger.debug(f"Joining in-flight GitHub search: {full_query}")
+        return await inflight
+
+    fut: asyncio.Future = asyncio.get_running_loop().create_future()
+    _search_inflight[sig] = fut
     try:
-        # Build search query with qualifiers
-        search_parts = [query]
-
-        if language:
-            search_parts.append(f"language:{language}")
-        if repo:
-            search_parts.append(f"repo:{repo}")
-        if org:
-            search_parts.append(f"org:{org}")
-        if user:
-            search_parts.append(f"user:{user}")
-        if path:
-            search_parts.append(f"path:{path}")
-        if extension:
-            search_parts.append(f"extension:{extension}")
-
-        full_query = " ".join(search_parts)
+        result = await _search_github_code_request(
+            query, full_query, max_results, sort, order, per_page,
+            language, repo, org, user, path, extension,
+        )
+        _search_cache[cache_key] = result
+        fut.set_result(result)
+        return result
+    except BaseException as e:
+        if not fut.done():
+            fut.set_exception(e)
+            # Mark retrieved so a burst with no waiters doesn't warn;
+            # awaiting callers still see the exception raised.
+            fut.exception()
+        raise
+    finally:
+        _search_inflight.pop(sig, None)
+
+
+def _build_full_query(
+    query: str,
+    language: Optional[str] = None,
+    repo: Optional[str] = None,
+    org: Optional[str] = None,
+    user: Optional[str] = None,
+    path: Optional[str] = None,
+    extension: Optional[str] = None,
+) -> str:
+    """Compose the search string with its qualifier filters."""
+    qualifiers = (
+        ("language", language),
+        ("repo", repo),
+        ("org", org),
+        ("user", user),
+        ("path", path),
+        ("extension", extension),
+    )
+    return " ".join(itertools.chain(
+        (query,),
+        (f"{name}:{value}" for name, value in qualifiers if value),
+    ))
+
 
+async def _search_github_code_request(
+    query: str,
+    full_query: str,
+    max_results: int,
+    sort: str,
+    order: str,
+    per_page: int,
+    language: Optional[str],
+    repo: Optional[str],
+    org: Optional[str],
+    user: Optional[str],
+    path: Optional[str],
+    extension: Optional[str],
+) -> Dict[str, Any]:
+    """
+    Execute a code search request against the GitHub API.
+
+    Cache and in-flight bookkeeping live in search_github_code_async;
+    this performs the actual HTTP round-trip and result formatting.
+    """
+    try:
         # Prepare API request
         url = "https://api.github.com/search/code"
-        headers = {
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "Jarvis-Voice-Assistant",
-        }
-
+        headers = _request_headers()
         token = get_github_token()
-        if token:
-            headers["Authorization"] = f"token {token}"
 
         params = {
             "q": full_query,
@@ -141,71 +739,44 @@ def search_github_code(
 
         logger.info(f"GitHub code search query: {full_query}")
 
-        # Make API request
-        with httpx.Client(timeout=15.0) as client:
-            response = client.get(url, params=params, headers=headers)
+        # Send the stored ETag so unchanged results come back as a free 304
+        etag_key = _etag_key(url, params)
+        etag_entry = _etag_store.get(etag_key)
+        if etag_entry is not None:
+            headers["If-None-Match"] = etag_entry[0]
+
+        # Make API request through the shared client, paced by the limiter
+        response = await _rate_limited_get("search", url, params, headers)
 
-            # Check rate limiting
-            if response.status_code == 403:
-                rate_limit_remaining = response.headers.get("X-RateLimit-Remaining", "0")
-                if rate_limit_remaining == "0":
-                    reset_time = response.headers.get("X-RateLimit-Reset", "unknown")
-                    raise GitHubSearchError(
-                        f"GitHub API rate limit exceeded. Resets at: {reset_time}. "
-                        "Consider setting GITHUB_TOKEN for higher limits."
-                    )
+        # Check rate limiting
+        if response.status_code == 403:
+            rate_limit_remaining = response.headers.get("X-RateLimit-Remaining", "0")
+            if rate_limit_remaining == "0":
+                reset_time = response.headers.get("X-RateLimit-Reset", "unknown")
+                raise GitHubSearchError(
+                    f"GitHub API rate limit exceeded. Resets at: {reset_time}. "
+                    "Consider setting GITHUB_TOKEN for higher limits."
+                )
 
+        if response.status_code == 304 and etag_entry is not None:
+            logger.debug(f"GitHub search not modified (304): {full_query}")
+            data = etag_entry[1]
+        else:
             response.raise_for_status()
-            data = response.json()
+            data = _json_loads(response.content)
+            etag = response.headers.get("ETag")
+            if etag:
+                _etag_store.set(etag_key, etag, data)
 
         # Limit results to max_results
         items = data.get("items", [])[:max_results]
 
-        # Format results with source attribution
-        formatted_items = []
-        for item in items:
-            formatted_item = {
-                "name": item.get("name"),
-                "path": item.get("path"),
-                "sha": item.get("sha"),
-                "url": item.get("url"),
-                "git_url": item.get("git_url"),
-                "html_url": item.get("html_url"),
-                "repository": {
-                    "id": item.get("repository", {}).get("id"),
-                    "name": item.get("repository", {}).get("name"),
-                    "full_name": item.get("repository", {}).get("full_name"),
-                    "owner": item.get("repository", {}).get("owner", {}).get("login"),
-                    "html_url": item.get("repository", {}).get("html_url"),
-                    "description": item.get("repository", {}).get("description"),
-                    "private": item.get("repository", {}).get("private", False),
-                },
-                "score": item.get("score"),
-                "source": {
-                    "type": "github",
-                    "platform": "GitHub Code Search",
-                    "repository": item.get("repository", {}).get("full_name"),
-                    "file_path": item.get("path"),
-                    "html_url": item.get("html_url"),
-                    "sha": item.get("sha"),
-                    "api_url": item.get("url"),
-                }
-            }
-
-            # Include text matches if available
-            if "text_matches" in item:
-                formatted_item["text_matches"] = [
-                    {
-                        "object_url": match.get("object_url"),
-                        "object_type": match.get("object_type"),
-                        "property": match.get("property"),
-                        "fragment": match.get("fragment"),
-                        "matches": match.get("matches", []),
-                    }
-                    for match in item.get("text_matches", [])
-                ]
-
-            formatted_items.append(formatted_item)
+        # Format results with source attribution in a single pass; the
+        # slotted CodeSearchItem does the nested-dict traversal once per
+        # item and serializes back to dicts only at the return boundary.
+        formatted_items = [
+            CodeSearchItem.from_api_item(item).to_dict() for item in items
+        ]
 
         # Build response with metadata
         result = {
@@ -256,15 +827,106 @@ def search_github_code(
         raise GitHubSearchError(f"GitHub code search failed: {e}")
 
 
-def get_file_content(
+def search_github_code(
+    query: str,
+    max_results: int = 5,
+    sort: str = "indexed",
+    order: str = "desc",
+    per_page: int = 30,
+    language: Optional[str] = None,
+    repo: Optional[str] = None,
+    org: Optional[str] = None,
+    user: Optional[str] = None,
+    path: Optional[str] = None,
+    extension: Optional[str] = None,
+    skip_cache: bool = False,
+) -> Dict[str, Any]:
+    """
+    Synchronous wrapper around search_github_code_async().
+
+    See search_github_code_async for full documentation. Async callers
+    should use the async variant directly to share the event loop.
+    """
+    return asyncio.run(search_github_code_async(
+        query=query,
+        max_results=max_results,
+        sort=sort,
+        order=order,
+        per_page=per_page,
+        language=language,
+        repo=repo,
+        org=org,
+        user=user,
+        path=path,
+        extension=extension,
+        skip_cache=skip_cache,
+    ))
+
+
+async def search_github_code_batch(
+    queries: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """
+    Run multiple code searches concurrently.
+
+    Each entry is a dict of keyword arguments accepted by
+    search_github_code_async. Results come back in request order; a
+    failed search is represented by a dict with an "error" key so one
+    failure does not abort the batch.
+
+    GitHub's GraphQL API does not expose code search, so batching is a
+    concurrent fan-out over the REST endpoint. The shared rate limiter,
+    result cache, and in-flight coalescing keep the upstream cost of a
+    batch at one request per distinct query.
+
+    Args:
+        queries: List of keyword-argument dicts for search_github_code_async
+
+    Returns:
+        List of search result dicts (or {"error": ...} entries) in the
+        same order as the queries
+
+    Example:
+        >>> results = await search_github_code_batch([
+        ...     {"query": "fastapi", "language": "python"},
+        ...     {"query": "websocket", "language": "python"},
+        ... ])
+    """
+    results = await asyncio.gather(
+        *(search_github_code_async(**q) for q in queries),
+        return_exceptions=True,
+    )
+
+    formatted = []
+    for q, result in zip(queries, results):
+        if isinstance(result, BaseException):
+            logger.error(
+                f"Batched GitHub search failed for {q.get('query')!r}: {result}"
+            )
+            formatted.append({
+                "error": str(result),
+                "query_metadata": {"original_query": q.get("query")},
+            })
+        else:
+            formatted.append(result)
+
+    return formatted
+
+
+async def get_file_content_async(
     owner: str,
     repo: str,
     path: str,
-    ref: Optional[str] = None
+    ref: Optional[str] = None,
+    skip_cache: bool = False,
 ) -> Dict[str, Any]:
     """
     Get the content of a specific file from a GitHub repository.
 
+    Async variant using the shared HTTP client. Results are cached
+    briefly by path, and indefinitely when ref pins a full commit SHA
+    (immutable content); pass skip_cache=True to force a fresh request.
+
     Args:
         owner: Repository owner (user or organization)
         repo: Repository name
@@ -295,32 +957,117 @@ def get_file_content(
         ... )
         >>> print(content['decoded_content'])
     """
+    path_key = (owner, repo, path, ref)
+    # Content addressed by a full commit SHA cannot change, so those
+    # fetches are served from (and stored in) the never-expiring blob
+    # cache; branch and tag refs only get the short path TTL.
+    pinned = _is_full_sha(ref)
+    if not skip_cache:
+        cached = _blob_cache.get(path_key) if pinned else None
+        if cached is None:
+            cached = _file_cache.get(path_key)
+        if cached is not None:
+            logger.debug(f"GitHub file cache hit: {owner}/{repo}/{path}")
+            return cached
+
+    # Coalesce concurrent fetches of the same file into one request
+    inflight = _file_inflight.get(path_key)
+    if inflight is not None:
+        logger.debug(f"Joining in-flight GitHub file fetch: {owner}/{repo}/{path}")
+        return await inflight
+
+    fut: asyncio.Future = asyncio.get_running_loop().create_future()
+    _file_inflight[path_key] = fut
     try:
-        url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}"
-        headers = {
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "Jarvis-Voice-Assistant",
-        }
+        result = await _get_file_content_request(owner, repo, path, ref)
+        _file_cache[path_key] = result
+        if pinned:
+            _blob_cache[path_key] = result
+        fut.set_result(result)
+        return result
+    except BaseException as e:
+        if not fut.done():
+            fut.set_exception(e)
+            # Mark retrieved so a burst with no waiters doesn't warn;
+            # awaiting callers still see the exception raised.
+            fut.exception()
+        raise
+    finally:
+        _file_inflight.pop(path_key, None)
 
-        token = get_github_token()
-        if token:
-            headers["Authorization"] = f"token {token}"
 
-        params = {}
-        if ref:
-            params["ref"] = ref
+async def _stream_download(url: str) -> Optional[str]:
+    """
+    Stream a raw file download, decoding UTF-8 incrementally.
+
+    Returns None if the download or decode fails, so callers can fall
+    back to the Contents API's base64 payload.
+    """
+    client = _get_client()
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    chunks: List[str] = []
+
+    try:
+        async with client.stream("GET", url) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                chunks.append(decoder.decode(chunk))
+        chunks.append(decoder.decode(b"", final=True))
+        return "".join(chunks)
+    except (httpx.HTTPError, UnicodeDecodeError) as e:
+        logger.warning(f"Raw download failed for {url}: {e}")
+        return None
+
+
+async def _get_file_content_request(
+    owner: str,
+    repo: str,
+    path: str,
+    ref: Optional[str],
+) -> Dict[str, Any]:
+    """
+    Execute a file-content request against the GitHub API.
+
+    Cache and in-flight bookkeeping live in get_file_content_async; this
+    performs the actual HTTP round-trip and decoding.
+    """
+    try:
+        url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}"
+        headers = _request_headers()
+
+        params = {"ref": ref} if ref else {}
 
         logger.info(f"Fetching GitHub file: {owner}/{repo}/{path}")
 
-        with httpx.Client(timeout=15.0) as client:
-            response = client.get(url, params=params, headers=headers)
+        # Send the stored ETag so unchanged files come back as a free 304
+        etag_key = _etag_key(url, params)
+        etag_entry = _etag_store.get(etag_key)
+        if etag_entry is not None:
+            headers["If-None-Match"] = etag_entry[0]
+
+        response = await _rate_limited_get("core", url, params, headers)
+
+        if response.status_code == 304 and etag_entry is not None:
+            logger.debug(f"GitHub file not modified (304): {owner}/{repo}/{path}")
+            data = etag_entry[1]
+        else:
             response.raise_for_status()
-            data = response.json()
+            data = _json_loads(response.content)
+            etag = response.headers.get("ETag")
+            if etag:
+                _etag_store.set(etag_key, etag, data)
 
-        # Decode base64 content if it's a file (not a directory)
+        # Fetch the raw blob via download_url rather than decoding the
+        # base64 payload: ~33% less data on the wire, and it still works
+        # for files over 1 MB where the Contents API omits content.
         decoded_content = None
-        if data.get("type") == "file" and data.get("content"):
-            import base64
+        download_url = data.get("download_url")
+        if data.get("type") == "file" and download_url:
+            decoded_content = await _stream_download(download_url)
+
+        # Fall back to the base64 payload when download_url is absent
+        # (submodules/symlinks) or the raw fetch failed
+        if decoded_content is None and data.get("type") == "file" and data.get("content"):
             try:
                 content_bytes = base64.b64decode(data.get("content", ""))
                 decoded_content = content_bytes.decode("utf-8")
@@ -363,3 +1110,70 @@ def get_file_content(
     except Exception as e:
         logger.error(f"GitHub file retrieval error: {e}")
         raise GitHubSearchError(f"Failed to retrieve file content: {e}")
+
+
+def get_file_content(
+    owner: str,
+    repo: str,
+    path: str,
+    ref: Optional[str] = None,
+    skip_cache: bool = False,
+) -> Dict[str, Any]:
+    """
+    Synchronous wrapper around get_file_content_async().
+
+    See get_file_content_async for full documentation. Async callers
+    should use the async variant directly to share the event loop.
+    """
+    return asyncio.run(get_file_content_async(owner, repo, path, ref, skip_cache))
+
+
+async def get_files_content(
+    refs: List[Tuple[str, str, str, Optional[str]]],
+) -> List[Dict[str, Any]]:
+    """
+    Fetch multiple files concurrently.
+
+    All requests go through the shared client, rate limiter, and caches,
+    so an N-file fetch takes roughly one round-trip of wall time instead
+    of N. Failures are returned per-entry so a single 404 does not kill
+    the batch.
+
+    Args:
+        refs: List of (owner, repo, path, ref) tuples; ref may be None
+
+    Returns:
+        List of result dicts in request order. Failed entries are dicts
+        with "error", "owner", "repo", "path", and "ref" keys.
+
+    Example:
+        >>> results = await get_files_content([
+        ...     ("fastapi", "fastapi", "fastapi/main.py", None),
+        ...     ("fastapi", "fastapi", "fastapi/routing.py", None),
+        ... ])
+    """
+    results = await asyncio.gather(
+        *(
+            get_file_content_async(owner, repo, path, ref)
+            for owner, repo, path, ref in refs
+        ),
+        return_exceptions=True,
+    )
+
+    formatted = []
+    for (owner, repo, path, ref), result in zip(refs, results):
+        if isinstance(result, BaseException):
+            logger.error(
+                f"Batched file fetch failed for {owner}/{repo}/{path}: {result}"
+            )
+            formatted.append({
+                "error": str(result),
+                "owner": owner,
+                "repo": repo,
+                "path": path,
+                "ref": ref,
+            })
+        else:
+            formatted.append(result)
+
+    return formatted
@@ -5,42 +5,224 @@ Provides document search capabilities using Pinecone vector database
 with proper source attribution for all results.
 """
 
+import asyncio
+import hashlib
 import os
+import random
+import threading
+import time
 from typing import List, Dict, Any, Optional
-from pinecone import Pinecone, ServerlessSpec
+import numpy as np
+from cachetools import TTLCache, cached
+from pinecone import Pinecone
 from loguru import logger
 
+# Prefer the gRPC client when the extras are installed: HTTP/2
+# multiplexing lets concurrent queries share one connection and skips
+# JSON serialization overhead. Falls back to the REST client otherwise.
+try:
+    from pinecone.grpc import PineconeGRPC
+except ImportError:
+    PineconeGRPC = None
+
 
 class PineconeSearchError(Exception):
     """Custom exception for Pinecone search errors."""
     pass
 
 
+# Client and index-handle singletons. Building a fresh Pinecone client and
+# re-listing indexes on every search adds two HTTP round-trips per query;
+# the client, index handles, and the index-name listing are created once
+# and reused.
+_pc: Optional[Pinecone] = None
+_pc_lock = threading.Lock()
+_index_cache: Dict[str, Any] = {}
+
+
 def initialize_pinecone() -> Pinecone:
     """
-    Initialize Pinecone client.
+    Initialize the Pinecone client (singleton).
+
+    The client is created once and reused across calls; repeat callers
+    pay no setup cost.
 
     Returns:
-        Pinecone: Initialized Pinecone client instance
+        Pinecone: Shared Pinecone client instance
 
     Raises:
         PineconeSearchError: If API key is missing or initialization fails
     """
-    api_key = os.getenv("PINECONE_API_KEY")
+    global _pc
 
-    if not api_key:
-        raise PineconeSearchError(
-            "PINECONE_API_KEY environment variable not set. "
-            "Please configure it in your .env file."
-        )
+    if _pc is not None:
+        return _pc
+
+    with _pc_lock:
+        if _pc is not None:
+            return _pc
+
+        api_key = os.getenv("PINECONE_API_KEY")
+
+        if not api_key:
+            raise PineconeSearchError(
+                "PINECONE_API_KEY environment variable not set. "
+                "Please configure it in your .env file."
+            )
+
+        client_cls = PineconeGRPC if PineconeGRPC is not None else Pinecone
+
+        try:
+            _pc = client_cls(api_key=api_key)
+            logger.info(
+                f"Pinecone client initialized successfully ({client_cls.__name__})"
+            )
+            return _pc
+        except Exception as e:
+            logger.error(f"Failed to initialize Pinecone: {e}")
+            raise PineconeSearchError(f"Failed to initialize Pinecone: {e}")
+
+
+# Index topology changes rarely; a short TTL keeps the existence check
+# and stats reads off the network in steady state while still picking up
+# newly created indexes without a restart.
+@cached(cache=TTLCache(maxsize=1, ttl=300))
+def _list_index_names() -> tuple:
+    """List index names, cached for 5 minutes."""
+    return tuple(initialize_pinecone().list_indexes().names())
+
+
+@cached(cache=TTLCache(maxsize=16, ttl=300))
+def _describe_stats(index_name: str):
+    """Describe index stats, cached for 5 minutes."""
+    return _get_index(index_name).describe_index_stats()
+
+
+def _get_index(index_name: str):
+    """
+    Get a cached index handle, validating that the index exists.
+
+    Args:
+        index_name: Name of the Pinecone index
+
+    Returns:
+        Index: Cached Pinecone index handle
+
+    Raises:
+        PineconeSearchError: If the index does not exist
+    """
+    index = _index_cache.get(index_name)
+    if index is None:
+        if index_name not in _list_index_names():
+            raise PineconeSearchError(f"Index '{index_name}' does not exist")
+
+        index = initialize_pinecone().Index(index_name)
+        _index_cache[index_name] = index
+
+    return index
+
+
+# Short-TTL query cache plus in-flight coalescing. Embedding-based
+# queries for the same semantic input tend to arrive in bursts; repeats
+# within the TTL are served from memory and concurrent duplicates share
+# one upstream call instead of fanning out identical queries.
+_query_cache: TTLCache = TTLCache(maxsize=2048, ttl=60)
+_query_cache_lock = threading.Lock()
+_query_inflight: Dict[bytes, asyncio.Future] = {}
 
-    try:
-        pc = Pinecone(api_key=api_key)
-        logger.info("Pinecone client initialized successfully")
-        return pc
-    except Exception as e:
-        logger.error(f"Failed to initialize Pinecone: {e}")
-        raise PineconeSearchError(f"Failed to initialize Pinecone: {e}")
+
+_QUERY_MAX_ATTEMPTS = 5
+
+
+def _is_transient_error(e: Exception) -> bool:
+    """Whether an SDK error is worth retrying (rate limit or 5xx)."""
+    if isinstance(e, (ConnectionError, TimeoutError)):
+        return True
+    status = getattr(e, "status", None) or getattr(e, "code", None)
+    return status in (429, 500, 502, 503, 504)
+
+
+def _backoff_delay(attempt: int, initial: float = 0.5, cap: float = 30.0) -> float:
+    """Exponential backoff with full jitter for the given attempt number."""
+    return random.uniform(0, min(cap, initial * (2 ** attempt)))
+
+
+def _query_cache_key(
+    query_vector: List[float],
+    index_name: str,
+    namespace: str,
+    top_k: int,
+    filter_metadata: Optional[Dict[str, Any]],
+    include_metadata: bool,
+) -> bytes:
+    """Build a compact digest key for a query's full parameter set."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(np.asarray(query_vector, dtype=np.float32).tobytes())
+    h.update(index_name.encode())
+    h.update(namespace.encode())
+    h.update(str(top_k).encode())
+    h.update(repr(sorted((filter_metadata or {}).items())).encode())
+    h.update(b"1" if include_metadata else b"0")
+    return h.digest()
+
+
+def _run_query(
+    query_vector: List[float],
+    index_name: str,
+    namespace: str,
+    top_k: int,
+    filter_metadata: Optional[Dict[str, Any]],
+    include_metadata: bool,
+    include_values: bool,
+):
+    """
+    Execute a Pinecone query and return the raw SDK response.
+
+    Shared by the list-of-dicts and columnar result formatters.
+    """
+    # Get cached index handle (client + existence check are cached)
+    index = _get_index(index_name)
+    logger.info(f"Querying Pinecone index: {index_name}")
+
+    # Normalize the query vector to float32 once. Pinecone stores
+    # fp32, so float64 precision is wasted bytes: the gRPC client
+    # takes the numpy array natively, and the REST path serializes
+    # shorter float32 reprs. Callers that already hold fp32 arrays
+    # from their embedding model skip the copy entirely.
+    if not (isinstance(query_vector, np.ndarray) and query_vector.dtype == np.float32):
+        query_vector = np.asarray(query_vector, dtype=np.float32)
+    if PineconeGRPC is None:
+        query_vector = query_vector.tolist()
+
+    search_params = {
+        "vector": query_vector,
+        "top_k": top_k,
+        "namespace": namespace,
+        "include_metadata": include_metadata,
+        "include_values": include_values,
+    }
+
+    if filter_metadata:
+        search_params["filter"] = filter_metadata
+
+    # Retry transient failures (429/5xx, connection drops) with
+    # exponential backoff and jitter rather than aborting on the first.
+    for attempt in range(_QUERY_MAX_ATTEMPTS):
+        try:
+            return index.query(**search_params)
+        except Exception as e:
+            if (
+                attempt == _QUERY_MAX_ATTEMPTS - 1
+                or not _is_transient_error(e)
+            ):
+                raise
+            wait = _backoff_delay(attempt)
+            logger.warning(
+                f"Pinecone query failed on attempt "
+                f"{attempt + 1}/{_QUERY_MAX_ATTEMPTS} ({e}), "
+                f"retrying in {wait:.1f}s"
+            )
+            time.sleep(wait)
 
 
 def search_pinecone(
@@ -86,30 +268,30 @@ def search_pinecone(
         ...     print(f"Document: {result['metadata']['title']}")
         ...     print(f"Source: {result['source']}")
     """
-    try:
-        # Initialize Pinecone client
-        pc = initialize_pinecone()
-
-        # Get index
-        if index_name not in pc.list_indexes().names():
-            raise PineconeSearchError(f"Index '{index_name}' does not exist")
-
-        index = pc.Index(index_name)
-        logger.info(f"Querying Pinecone index: {index_name}")
-
-        # Perform search
-        search_params = {
-            "vector": query_vector,
-            "top_k": top_k,
-            "namespace": namespace,
-            "include_metadata": include_metadata,
-            "include_values": include_values,
-        }
-
-        if filter_metadata:
-            search_params["filter"] = filter_metadata
+    # Caching is skipped when vector values are requested: those
+    # payloads are large and rarely repeated.
+    cache_key = None
+    if not include_values:
+        cache_key = _query_cache_key(
+            query_vector, index_name, namespace, top_k,
+            filter_metadata, include_metadata,
+        )
+        with _query_cache_lock:
+            cached = _query_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Pinecone query cache hit for index: {index_name}")
+            return cached
 
-        results = index.query(**search_params)
+    try:
+        results = _run_query(
+            query_vector,
+            index_name=index_name,
+            namespace=namespace,
+            top_k=top_k,
+            filter_metadata=filter_metadata,
+            include_metadata=include_metadata,
+            include_values=include_values,
+        )
 
         # Format results with source attribution
         formatted_results = []
@@ -143,6 +325,11 @@ def search_pinecone(
             formatted_results.append(result)
 
         logger.info(f"Pinecone search returned {len(formatted_results)} results")
+
+        if cache_key is not None:
+            with _query_cache_lock:
+                _query_cache[cache_key] = formatted_results
+
         return formatted_results
 
     except PineconeSearchError:
@@ -152,6 +339,155 @@ def search_pinecone(
         raise PineconeSearchError(f"Search operation failed: {e}")
 
 
+def search_pinecone_soa(
+    query_vector: List[float],
+    index_name: str = "jarvis-docs",
+    namespace: str = "",
+    top_k: int = 5,
+    filter_metadata: Optional[Dict[str, Any]] = None,
+    include_metadata: bool = True,
+) -> Dict[str, Any]:
+    """
+    Search Pinecone and return results in columnar (SoA) form.
+
+    Unlike search_pinecone, which builds one dict per match, this packs
+    scores into a single float32 numpy array so downstream ranking and
+    filtering can be vectorized (e.g. ``mask = results["scores"] > 0.8``)
+    instead of looping over Python objects.
+
+    Args:
+        query_vector: The query embedding vector (list of floats)
+        index_name: Name of the Pinecone index to query
+        namespace: Namespace within the index (optional)
+        top_k: Number of top results to return
+        filter_metadata: Metadata filter for results (optional)
+        include_metadata: Whether to include metadata in results
+
+    Returns:
+        Dictionary with parallel columns:
+        - ids: Tuple of document IDs
+        - scores: np.ndarray of float32 similarity scores
+        - metadata: List of metadata dicts (None entries when absent)
+        - source: Attribution for the query as a whole
+
+    Raises:
+        PineconeSearchError: If search fails
+    """
+    try:
+        results = _run_query(
+            query_vector,
+            index_name=index_name,
+            namespace=namespace,
+            top_k=top_k,
+            filter_metadata=filter_metadata,
+            include_metadata=include_metadata,
+            include_values=False,
+        )
+
+        matches = results.matches
+        soa = {
+            "ids": tuple(m.id for m in matches),
+            "scores": np.asarray([m.score for m in matches], dtype=np.float32),
+            "metadata": [m.metadata for m in matches] if include_metadata else [],
+            "source": {
+                "type": "pinecone",
+                "index": index_name,
+                "namespace": namespace,
+            },
+        }
+
+        logger.info(f"Pinecone SoA search returned {len(matches)} results")
+        return soa
+
+    except PineconeSearchError:
+        raise
+    except Exception as e:
+        logger.error(f"Pinecone search failed: {e}")
+        raise PineconeSearchError(f"Search operation failed: {e}")
+
+
+async def search_pinecone_async(
+    query_vector: List[float],
+    index_name: str = "jarvis-docs",
+    namespace: str = "",
+    top_k: int = 5,
+    filter_metadata: Optional[Dict[str, Any]] = None,
+    include_metadata: bool = True,
+    include_values: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Async variant of search_pinecone.
+
+    The SDK query call is blocking, so it runs in a worker thread to
+    keep the event loop free; concurrent searches share the singleton
+    client (and its gRPC channel when available). Concurrent duplicate
+    queries are coalesced into one upstream call: late arrivals await
+    the first caller's future instead of issuing their own query.
+
+    See search_pinecone for argument and result documentation.
+    """
+    sig = None
+    if not include_values:
+        sig = _query_cache_key(
+            query_vector, index_name, namespace, top_k,
+            filter_metadata, include_metadata,
+        )
+        inflight = _query_inflight.get(sig)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+    fut: asyncio.Future = asyncio.get_running_loop().create_future()
+    if sig is not None:
+        _query_inflight[sig] = fut
+
+    try:
+        result = await asyncio.to_thread(
+            search_pinecone,
+            query_vector,
+            index_name=index_name,
+            namespace=namespace,
+            top_k=top_k,
+            filter_metadata=filter_metadata,
+            include_metadata=include_metadata,
+            include_values=include_values,
+        )
+        if not fut.done():
+            fut.set_result(result)
+        return result
+    except BaseException as e:
+        if not fut.done():
+            fut.set_exception(e)
+            # Mark retrieved so a burst with no waiters doesn't warn;
+            # awaiting callers still see the exception raised.
+            fut.exception()
+        raise
+    finally:
+        if sig is not None:
+            _query_inflight.pop(sig, None)
+
+
+async def search_pinecone_batch(
+    query_vectors: List[List[float]],
+    **kwargs: Any,
+) -> List[List[Dict[str, Any]]]:
+    """
+    Run multiple Pinecone searches concurrently.
+
+    Args:
+        query_vectors: One query embedding per search
+        **kwargs: Passed through to search_pinecone_async
+
+    Returns:
+        List of result lists in the same order as the query vectors
+
+    Raises:
+        PineconeSearchError: If any search fails
+    """
+    return list(await asyncio.gather(
+        *(search_pinecone_async(v, **kwargs) for v in query_vectors)
+    ))
+
+
 def get_index_stats(index_name: str = "jarvis-docs") -> Dict[str, Any]:
     """
     Get statistics about a Pinecone index.
@@ -166,13 +502,7 @@ def get_index_stats(index_name: str = "jarvis-docs") -> Dict[str, Any]:
         PineconeSearchError: If stats retrieval fails
     """
     try:
-        pc = initialize_pinecone()
-
-        if index_name not in pc.list_indexes().names():
-            raise PineconeSearchError(f"Index '{index_name}' does not exist")
-
-        index = pc.Index(index_name)
-        stats = index.describe_index_stats()
+        stats = _describe_stats(index_name)
 
         return {
             "index_name": index_name,
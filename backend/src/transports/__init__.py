@@ -0,0 +1,6 @@
+# Transport layer for Jarvis
+from .websocket_transport import WebSocketTransport
+
+__all__ = [
+    "WebSocketTransport",
+]
@@ -0,0 +1,421 @@
+"""WebSocket transport bridging the browser and the Pipecat pipeline."""
+import asyncio
+from collections import deque
+from typing import Any, Optional
+
+import numpy as np
+from fastapi import WebSocket
+from pipecat.frames.frames import (
+    AudioRawFrame,
+    TTSAudioRawFrame,
+    UserStartedSpeakingFrame,
+    UserStoppedSpeakingFrame,
+)
+from pipecat.pipeline.task import PipelineTask
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from loguru import logger
+
+from ..config.settings import settings
+
+
+class _WebSocketInputProcessor(FrameProcessor):
+    """Pipeline entry point; inbound frames arrive via task.queue_frame."""
+
+    async def process_frame(self, frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        await self.push_frame(frame, direction)
+
+
+class _WebSocketOutputProcessor(FrameProcessor):
+    """Pipeline exit point; hands output frames to the transport queue."""
+
+    def __init__(self, transport: "WebSocketTransport", **kwargs):
+        super().__init__(**kwargs)
+        self._transport = transport
+
+    async def process_frame(self, frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        await self._transport.receive_frame(frame)
+        await self.push_frame(frame, direction)
+
+
+class WebSocketTransport:
+    """
+    Audio transport between a browser WebSocket and the voice pipeline.
+
+    Inbound microphone chunks are queued from the WebSocket handler and
+    fed into the pipeline; outbound TTS frames are queued by the pipeline
+    and written back to the socket. Both queues are bare deques paired
+    with a single-consumer asyncio.Future wakeup instead of asyncio.Queue:
+    producers append and set the waiter, consumers pop until empty and
+    only then park on a fresh Future. This avoids the per-iteration
+    TimerHandle allocation of wait_for(..., timeout=...) polling and
+    asyncio.Queue's getter/putter bookkeeping on the audio hot path.
+    """
+
+    # Cap on coalesced outbound batches; keeps a single send within the
+    # browser's playback jitter budget.
+    MAX_BATCH_BYTES = 64 * 1024
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        sample_rate: int = 16000,
+        num_channels: int = 1,
+        batch_output: bool = True,
+        max_output_frames: int = 32,
+    ):
+        """
+        Initialize the WebSocket transport.
+
+        Args:
+            websocket: Accepted FastAPI WebSocket connection
+            sample_rate: PCM sample rate of the audio stream
+            num_channels: Number of audio channels
+            batch_output: Coalesce queued TTS chunks into one send
+            max_output_frames: Output queue depth before oldest frames drop
+        """
+        self.websocket = websocket
+        self.sample_rate = sample_rate
+        self.num_channels = num_channels
+        self.batch_output = batch_output
+        self.max_output_frames = max_output_frames
+        self._drop_count = 0
+        self._frame_id_counter = 0
+
+        self._task: Optional[PipelineTask] = None
+
+        # Bare deque + one-shot Future wakeup (single consumer). Only the
+        # output path needs a queue: inbound audio goes straight to the
+        # pipeline task from send_audio.
+        self._output_queue: deque = deque()
+        self._output_waiter: Optional[asyncio.Future] = None
+
+        self._stop_event = asyncio.Event()
+        self._output_task: Optional[asyncio.Task] = None
+        self._stats_task: Optional[asyncio.Task] = None
+
+        # Aggregate throughput counters, logged periodically instead of
+        # per chunk
+        self._stats = {
+            "in_bytes": 0,
+            "in_chunks": 0,
+            "out_bytes": 0,
+            "out_chunks": 0,
+        }
+
+        # Rotating pools of prebuilt VAD sentinel frames. The frames are
+        # stateless apart from their id, which is refreshed on each send,
+        # so a burst of speaking transitions allocates nothing.
+        self._start_speaking_frames: deque = deque(
+            UserStartedSpeakingFrame(emulated=True) for _ in range(4)
+        )
+        self._stop_speaking_frames: deque = deque(
+            UserStoppedSpeakingFrame(emulated=True) for _ in range(4)
+        )
+
+        # Recycled AudioRawFrame instances for the input path. Bounded at
+        # 64 entries so the pool itself never pins a large generation of
+        # long-lived objects.
+        self._frame_pool: deque = deque(maxlen=64)
+
+        # Reusable send buffer: batches are assembled in place instead of
+        # growing a fresh bytearray per send, so the steady state makes
+        # one allocation per send (the outgoing bytes) rather than one
+        # per drained chunk.
+        self._send_buf = bytearray(self.MAX_BATCH_BYTES)
+        self._send_view = memoryview(self._send_buf)
+
+        logger.info("WebSocket transport initialized")
+
+    def input(self) -> FrameProcessor:
+        """Pipeline input processor for this transport."""
+        return _WebSocketInputProcessor()
+
+    def output(self) -> FrameProcessor:
+        """Pipeline output processor for this transport."""
+        return _WebSocketOutputProcessor(self)
+
+    @staticmethod
+    def _wake(waiter: Optional[asyncio.Future]) -> None:
+        """Wake a parked consumer, if one is waiting."""
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    async def _wait_for_item(self, queue: deque, waiter_attr: str) -> bool:
+        """
+        Park on a fresh Future until the queue has an item or stop is set.
+
+        Returns:
+            bool: True if the transport should keep consuming
+        """
+        while not queue:
+            if self._stop_event.is_set():
+                return False
+            waiter = asyncio.get_running_loop().create_future()
+            setattr(self, waiter_attr, waiter)
+            try:
+                await waiter
+            finally:
+                setattr(self, waiter_attr, None)
+        return not self._stop_event.is_set()
+
+    async def start(self, task: PipelineTask) -> None:
+        """
+        Start the transport's I/O tasks against a pipeline task.
+
+        Args:
+            task: Pipeline task to feed inbound audio frames into
+        """
+        self._task = task
+        self._stop_event.clear()
+        self._output_task = asyncio.create_task(self._output_task_handler())
+        self._stats_task = asyncio.create_task(self._stats_logger())
+        logger.info("WebSocket transport started")
+
+    async def stop(self) -> None:
+        """Stop the transport and wake any parked consumers."""
+        self._stop_event.set()
+        self._wake(self._output_waiter)
+
+        for task in (self._output_task, self._stats_task):
+            if task is not None:
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
+        self._output_task = None
+        self._stats_task = None
+        logger.info("WebSocket transport stopped")
+
+    async def _stats_logger(self) -> None:
+        """Log aggregate audio throughput every 5 seconds."""
+        stats = self._stats
+        while not self._stop_event.is_set():
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=5.0)
+            except asyncio.TimeoutError:
+                pass
+            if stats["in_chunks"] or stats["out_chunks"]:
+                logger.info(
+                    f"Audio throughput: in {stats['in_chunks']} chunks "
+                    f"({stats['in_bytes']} B), out {stats['out_chunks']} "
+                    f"chunks ({stats['out_bytes']} B)"
+                )
+                stats["in_bytes"] = stats["in_chunks"] = 0
+                stats["out_bytes"] = stats["out_chunks"] = 0
+
+    async def send_audio(self, audio_data: bytes) -> None:
+        """
+        Queue a microphone audio chunk for the pipeline.
+
+        Args:
+            audio_data: Raw PCM bytes (s16le) from the browser
+        """
+        # Sample stats are debug-only: scanning every PCM sample 50x/sec
+        # per connection is pure overhead in production. When enabled,
+        # numpy's SIMD reductions replace the Python-level min()/max().
+        if settings.DEBUG and audio_data:
+            samples = np.frombuffer(audio_data, dtype=np.int16)
+            logger.debug(
+                f"Audio chunk: {len(audio_data)} bytes, "
+                f"min={int(samples.min())}, max={int(samples.max())}"
+            )
+
+        if self._task is None:
+            return
+
+        # Queue straight into the pipeline: the old input deque existed
+        # only to hand bytes between two coroutines on the same loop, and
+        # removing the hop halves the context switches per audio chunk.
+        frame = self._rent_frame(audio_data)
+        await self._task.queue_frame(frame)
+
+        self._stats["in_chunks"] += 1
+        self._stats["in_bytes"] += len(audio_data)
+
+    async def receive_frame(self, frame: Any) -> None:
+        """
+        Queue a pipeline output frame for delivery to the browser.
+
+        Args:
+            frame: Pipecat frame emitted by the pipeline output
+        """
+        # Audio is real-time: if the client sink stalls, stale TTS frames
+        # only add latency, so the queue drops from the front rather than
+        # growing without bound (bufferbloat).
+        if len(self._output_queue) >= self.max_output_frames:
+            self._output_queue.popleft()
+            self._drop_count += 1
+            if self._drop_count % 50 == 1:
+                logger.warning(
+                    f"Output queue full; dropped {self._drop_count} "
+                    "frames so far (slow WebSocket sink?)"
+                )
+
+        self._output_queue.append(frame)
+        self._wake(self._output_waiter)
+
+    async def _queue_sentinel(self, pool: deque) -> None:
+        """Queue a pooled sentinel frame, rotating it with a fresh id."""
+        if self._task is None:
+            return
+        frame = pool[0]
+        pool.rotate(-1)
+        self._assign_frame_id(frame)
+        await self._task.queue_frame(frame)
+
+    async def user_started_speaking(self) -> None:
+        """Signal the pipeline that the user started speaking."""
+        await self._queue_sentinel(self._start_speaking_frames)
+
+    async def user_stopped_speaking(self) -> None:
+        """Signal the pipeline that the user stopped speaking."""
+        await self._queue_sentinel(self._stop_speaking_frames)
+
+    def _assign_frame_id(self, frame: Any) -> None:
+        """
+        Give a frame a session-unique 31-bit id.
+
+        Frame ids only need uniqueness within a session, so a monotonic
+        counter suffices; uuid4 read 16 bytes from the CSPRNG and built a
+        128-bit int per frame, 50x/sec per connection.
+        """
+        self._frame_id_counter = (self._frame_id_counter + 1) & 0x7FFFFFFF
+        frame.id = self._frame_id_counter
+
+    def _rent_frame(self, audio: bytes) -> AudioRawFrame:
+        """
+        Get an AudioRawFrame from the pool, or allocate one.
+
+        At 50 chunks/sec per connection, fresh medium-lived frame objects
+        promote across GC generations and trigger periodic collections;
+        reinitializing a pooled instance avoids that churn.
+
+        Args:
+            audio: PCM payload for the frame
+
+        Returns:
+            AudioRawFrame: Frame ready to queue into the pipeline
+        """
+        if self._frame_pool:
+            frame = self._frame_pool.pop()
+            frame.audio = audio
+            frame.sample_rate = self.sample_rate
+            frame.num_channels = self.num_channels
+            # Reinitializing bypasses __post_init__, which derives
+            # num_frames from the payload; recompute it here or a reused
+            # frame reports the previous chunk's duration downstream
+            # (STTService accumulates num_frames for silence tracking).
+            frame.num_frames = len(audio) // (self.num_channels * 2)
+        else:
+            frame = AudioRawFrame(
+                audio=audio,
+                sample_rate=self.sample_rate,
+                num_channels=self.num_channels,
+            )
+        self._assign_frame_id(frame)
+        return frame
+
+    def _return_frame(self, frame: Any) -> None:
+        """
+        Return a finished frame to the pool.
+
+        Only plain AudioRawFrame instances are pooled — Pipecat's own
+        subclasses (e.g. TTS output frames) carry service state and are
+        left for the garbage collector.
+
+        Args:
+            frame: Frame the pipeline is done with
+        """
+        if type(frame) is AudioRawFrame:
+            frame.audio = b""
+            self._frame_pool.append(frame)
+
+    def _drain_output_batch(self, first_audio: bytes) -> bytes:
+        """
+        Coalesce already-queued audio frames behind the first chunk.
+
+        Each WebSocket send pays framing, TLS record, and TCP segment
+        overhead that dwarfs a small TTS chunk; one batched send
+        amortizes all three. Only frames already in the queue are taken
+        — this never waits for more audio.
+
+        Args:
+            first_audio: Audio payload of the frame already dequeued
+
+        Returns:
+            bytes: Concatenated payload for a single send
+        """
+        if len(first_audio) >= self.MAX_BATCH_BYTES:
+            return first_audio
+
+        view = self._send_view
+        total = len(first_audio)
+        view[:total] = first_audio
+        queue = self._output_queue
+        cap = self.MAX_BATCH_BYTES
+
+        while queue and total < cap:
+            audio = getattr(queue[0], "audio", None)
+            if audio is None:
+                # Non-audio frame; leave it for the next iteration
+                break
+            if total + len(audio) > cap:
+                break
+            self._return_frame(queue.popleft())
+            view[total:total + len(audio)] = audio
+            total += len(audio)
+
+        return bytes(view[:total])
+
+    async def _send_audio_frame(self, frame: AudioRawFrame) -> bool:
+        """
+        Send one (possibly batched) audio frame to the WebSocket.
+
+        Args:
+            frame: Dequeued audio frame
+
+        Returns:
+            bool: False if the socket failed and the loop should stop
+        """
+        audio = frame.audio
+
+        if self.batch_output:
+            payload = self._drain_output_batch(audio)
+        else:
+            payload = audio
+
+        logger.debug(f"Sending audio frame: {len(payload)} bytes")
+
+        try:
+            await self.websocket.send_bytes(payload)
+        except Exception as e:
+            logger.error(f"WebSocket send failed: {e}")
+            return False
+
+        self._stats["out_chunks"] += 1
+        self._stats["out_bytes"] += len(payload)
+        self._return_frame(frame)
+        return True
+
+    async def _output_task_handler(self) -> None:
+        """Write queued pipeline output frames back to the WebSocket."""
+        # Type dispatch: the output path is overwhelmingly audio frames,
+        # and one dict lookup on type(frame) is cheaper than probing each
+        # frame with getattr defaults.
+        dispatch = {
+            AudioRawFrame: self._send_audio_frame,
+            TTSAudioRawFrame: self._send_audio_frame,
+        }
+
+        while await self._wait_for_item(self._output_queue, "_output_waiter"):
+            frame = self._output_queue.popleft()
+
+            handler = dispatch.get(type(frame))
+            if handler is None:
+                continue
+
+            if not await handler(frame):
+                break
@@ -25,27 +25,47 @@ For full end-to-end testing, use the services within the FastAPI WebSocket
 server where they're properly integrated into Pipecat pipelines.
 """
 import asyncio
+import contextlib
 import os
 import sys
-from pathlib import Path
 from loguru import logger
 from typing import AsyncIterator
+from unittest import mock
 import time
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent))
-
 from src.services import DeepgramSTTService, OpenAILLMService, ElevenLabsTTSService
 from src.config.settings import settings
 from pipecat.frames.frames import TextFrame, AudioRawFrame
 
-
-# Configure logging
+# With JARVIS_TEST_MOCK=1 the pipecat SDK constructors are replaced with
+# in-process fakes, so the suite exercises our wrapper wiring without
+# paying DNS/TLS/SDK-handshake cost or needing live API keys.
+MOCK_SERVICES = os.environ.get("JARVIS_TEST_MOCK", "").lower() in ("1", "true")
+
+
+@contextlib.contextmanager
+def mock_sdk_services():
+    """Patch the pipecat SDK constructors with MagicMock factories."""
+    with mock.patch(
+        "src.services.deepgram_service.PipecatDeepgramSTT", mock.MagicMock()
+    ), mock.patch(
+        "src.services.openai_service.PipecatOpenAILLM", mock.MagicMock()
+    ), mock.patch(
+        "src.services.elevenlabs_service.PipecatElevenLabsTTS", mock.MagicMock()
+    ):
+        yield
+
+
+# Configure logging. A test harness doesn't need the timestamped,
+# ANSI-colored production format — markup parsing and colorization cost
+# far more per record than the log call itself, and this output is read
+# once from a terminal or CI log.
 logger.remove()
 logger.add(
     sys.stderr,
-    format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>",
-    level="INFO"
+    format="{level: <8} | {message}",
+    level="INFO",
+    colorize=False,
 )
 
 
@@ -91,18 +111,22 @@ class PipelineTestSuite:
         logger.info("Testing Deepgram STT service...")
 
         try:
-            self.stt_service = DeepgramSTTService(
+            # Build locally and publish to self only once ready: the
+            # service tests run concurrently, so partially initialized
+            # services should never be visible on the shared suite.
+            stt_service = DeepgramSTTService(
                 api_key=settings.DEEPGRAM_API_KEY
             )
 
-            stt = self.stt_service.create_service(
+            stt = stt_service.create_service(
                 model="nova-2",
                 language="en-US",
                 smart_format=True,
                 interim_results=True
             )
 
-            assert self.stt_service.is_ready, "STT service not ready"
+            assert stt_service.is_ready, "STT service not ready"
+            self.stt_service = stt_service
             logger.success("Deepgram STT service initialized successfully")
             return True
 
@@ -115,21 +139,22 @@ class PipelineTestSuite:
         logger.info("Testing OpenAI LLM service...")
 
         try:
-            self.llm_service = OpenAILLMService(
+            llm_service = OpenAILLMService(
                 api_key=settings.OPENAI_API_KEY
             )
 
-            llm = self.llm_service.create_service(
+            llm = llm_service.create_service(
                 model="gpt-4-turbo-preview",
                 temperature=0.7,
                 max_tokens=150  # Limit for testing
             )
 
-            self.llm_service.set_system_prompt(
+            llm_service.set_system_prompt(
                 "You are a helpful assistant. Give very brief responses."
             )
 
-            assert self.llm_service.is_ready, "LLM service not ready"
+            assert llm_service.is_ready, "LLM service not ready"
+            self.llm_service = llm_service
             logger.success("✓ OpenAI LLM service initialized successfully")
             logger.success("✓ Model configured: gpt-4-turbo-preview")
             logger.success("✓ System prompt set")
@@ -146,11 +171,11 @@ class PipelineTestSuite:
         logger.info("Testing ElevenLabs TTS service...")
 
         try:
-            self.tts_service = ElevenLabsTTSService(
+            tts_service = ElevenLabsTTSService(
                 api_key=settings.ELEVENLABS_API_KEY
             )
 
-            tts = self.tts_service.create_service(
+            tts = tts_service.create_service(
                 voice_id="21m00Tcm4TlvDq8ikWAM",  # Rachel
                 model="eleven_turbo_v2_5",
                 stability=0.5,
@@ -158,7 +183,8 @@ class PipelineTestSuite:
                 optimize_streaming_latency=3
             )
 
-            assert self.tts_service.is_ready, "TTS service not ready"
+            assert tts_service.is_ready, "TTS service not ready"
+            self.tts_service = tts_service
             logger.success("✓ ElevenLabs TTS service initialized successfully")
             logger.success("✓ Voice configured: Rachel (21m00Tcm4TlvDq8ikWAM)")
             logger.success("✓ Model configured: eleven_turbo_v2_5")
@@ -199,18 +225,41 @@ class PipelineTestSuite:
         logger.info("Starting Jarvis Pipeline Test Suite")
         logger.info("=" * 80)
 
-        results = {
-            "API Keys": self.verify_api_keys(),
-        }
+        # perf_counter: monotonic and unaffected by clock adjustments,
+        # unlike time.time()
+        suite_start = time.perf_counter()
 
-        if not results["API Keys"]:
-            logger.error("API key verification failed. Cannot proceed with tests.")
-            return False
+        if MOCK_SERVICES:
+            logger.info("Mock mode: SDK constructors patched, skipping API key check")
+            results = {"API Keys": True}
+        else:
+            results = {
+                "API Keys": self.verify_api_keys(),
+            }
+
+            if not results["API Keys"]:
+                logger.error("API key verification failed. Cannot proceed with tests.")
+                return False
 
-        # Run async tests
-        results["Deepgram STT"] = await self.test_deepgram_stt()
-        results["OpenAI LLM"] = await self.test_openai_llm()
-        results["ElevenLabs TTS"] = await self.test_elevenlabs_tts()
+        # The three service tests touch independent services, so run them
+        # concurrently; return_exceptions keeps one failure from hiding
+        # the other results.
+        service_results = await asyncio.gather(
+            self.test_deepgram_stt(),
+            self.test_openai_llm(),
+            self.test_elevenlabs_tts(),
+            return_exceptions=True,
+        )
+        for test_name, result in zip(
+            ("Deepgram STT", "OpenAI LLM", "ElevenLabs TTS"), service_results
+        ):
+            if isinstance(result, BaseException):
+                logger.error(f"{test_name} test raised: {result}")
+                result = False
+            results[test_name] = result
+
+        # The end-to-end check depends on the services above, so it stays
+        # sequential.
         results["End-to-End Flow"] = await self.test_end_to_end_text_flow()
 
         # Print summary
@@ -226,6 +275,8 @@ class PipelineTestSuite:
             if not passed:
                 all_passed = False
 
+        elapsed = time.perf_counter() - suite_start
+        logger.info(f"  Total time: {elapsed:.2f}s")
         logger.info("=" * 80)
 
         if all_passed:
@@ -239,7 +290,11 @@ class PipelineTestSuite:
 async def main():
     """Main test entry point."""
     test_suite = PipelineTestSuite()
-    success = await test_suite.run_all_tests()
+    if MOCK_SERVICES:
+        with mock_sdk_services():
+            success = await test_suite.run_all_tests()
+    else:
+        success = await test_suite.run_all_tests()
 
     # Exit with appropriate code
     sys.exit(0 if success else 1)
@@ -3,8 +3,39 @@
 Test script to verify backend environment is correctly configured.
 """
 
+import hashlib
 import sys
 import importlib
+import importlib.util
+from pathlib import Path
+
+# Marker written after a fully passing check; keyed on the interpreter
+# and sys.path so a new venv, Python upgrade, or moved checkout
+# invalidates it.
+_MARKER_FILE = Path("~/.cache/jarvis/env_ok").expanduser()
+
+
+def _environment_key() -> str:
+    """Fingerprint of the interpreter and import path."""
+    raw = sys.version + "|".join(sys.path)
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def _cached_ok() -> bool:
+    """True when a previous full pass matches this environment."""
+    try:
+        return _MARKER_FILE.read_text().strip() == _environment_key()
+    except OSError:
+        return False
+
+
+def _write_marker() -> None:
+    """Record a fully passing check for this environment."""
+    try:
+        _MARKER_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _MARKER_FILE.write_text(_environment_key())
+    except OSError:
+        pass  # caching is best-effort; never fail the check over it
 
 
 def test_python_version():
@@ -18,20 +49,39 @@ def test_python_version():
         return False
 
 
-def test_import(module_name, package_name=None):
-    """Test if a module can be imported."""
+def test_import(module_name, package_name=None, deep=False):
+    """
+    Test if a module is installed.
+
+    Resolves the module spec instead of importing, so heavyweight
+    packages (pipecat, pydantic, fastapi) are not executed just to
+    confirm they exist. Pass deep=True to force a real import when a
+    package's import-time side effects matter.
+    """
     display_name = package_name or module_name
     try:
-        importlib.import_module(module_name)
+        if deep:
+            importlib.import_module(module_name)
+            found = True
+        else:
+            found = importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        found = False
+
+    if found:
         print(f"✓ {display_name} installed")
         return True
-    except ImportError:
-        print(f"✗ {display_name} not installed")
-        return False
+    print(f"✗ {display_name} not installed")
+    return False
 
 
 def main():
-    """Run all setup tests."""
+    """Run all setup tests (pass --force to skip the cached result)."""
+    if "--force" not in sys.argv and _cached_ok():
+        print("✓ Environment previously verified (cached). "
+              "Run with --force to re-check.")
+        return 0
+
     print("=" * 50)
     print("Jarvis Backend Environment Test")
     print("=" * 50)
@@ -59,6 +109,7 @@ def main():
 
     if passed == total:
         print("✓ All tests passed! Environment is ready.")
+        _write_marker()
         return 0
     else:
         print("✗ Some tests failed. Run: pip install -r requirements.txt")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Voice-flow smoke test.
+
+Drives one STT round trip through a pluggable transcript source. The
+default source resolves in-process, so the script verifies the flow
+plumbing (audio chunking, awaiting a transcript, timeout handling) in
+milliseconds without opening a WebSocket to Deepgram. A live source can
+be passed to run_flow by wiring a coroutine that resolves on the real
+service's transcript callback.
+"""
+import asyncio
+import sys
+from typing import Awaitable, Callable
+
+from loguru import logger
+
+# Plain test-harness log format; see test_pipeline.py
+logger.remove()
+logger.add(
+    sys.stderr,
+    format="{level: <8} | {message}",
+    level="INFO",
+    colorize=False,
+)
+
+# 10 ms of 16 kHz s16le mono silence, the chunk size the transport sends
+SILENCE_CHUNK = b"\x00" * 320
+
+
+async def mock_transcript_source() -> str:
+    """In-process transcript source resolving on the next loop tick."""
+    await asyncio.sleep(0)
+    return "hello world"
+
+
+async def mock_audio_sink(chunk: bytes) -> None:
+    """In-process audio sink standing in for the transport send path."""
+    await asyncio.sleep(0)
+
+
+async def run_flow(
+    transcript_source: Awaitable[str],
+    audio_sink: Callable[[bytes], Awaitable[None]] = mock_audio_sink,
+) -> str:
+    """
+    Run one voice-flow round trip against a transcript source.
+
+    There is a single code path: the source and sink abstract where the
+    transcript comes from and where the audio goes (mocked coroutines in
+    tests, the Deepgram callback and transport send in a live run), so
+    no separate timeout-fallback branch has to duplicate the happy path.
+
+    Args:
+        transcript_source: Awaitable resolving to the transcript text
+        audio_sink: Coroutine receiving each streamed audio chunk
+
+    Returns:
+        str: The transcript produced for the streamed audio
+    """
+    # Stream a second of silence through the sink in the transport's
+    # chunk size.
+    for _ in range(100):
+        await audio_sink(SILENCE_CHUNK)
+
+    # 1.5s is generous for a real Deepgram interim and irrelevant for
+    # the mocked source; a tight bound surfaces regressions quickly
+    # instead of stalling CI for the worst case. asyncio.timeout scopes
+    # the deadline without wrapping the awaitable in an extra task.
+    async with asyncio.timeout(1.5):
+        transcript = await transcript_source
+    logger.info(f"Transcript: {transcript!r}")
+    return transcript
+
+
+async def main():
+    """Run the voice flow against the mocked transcript source."""
+    logger.info("Running voice-flow smoke test...")
+    try:
+        transcript = await run_flow(mock_transcript_source())
+    except asyncio.TimeoutError:
+        logger.error("Voice flow timed out waiting for a transcript")
+        return 1
+
+    if not transcript:
+        logger.error("Voice flow produced an empty transcript")
+        return 1
+
+    logger.success("Voice flow completed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+"""
+Accuracy test runner for the Jarvis tool integrations.
+
+Drives the queries in test_queries.json against the real tool layer
+(GitHub code search and the Company API), records whether each response
+carries source attribution, and writes a results file plus a review
+skeleton for manual scoring with calculate_accuracy.py.
+"""
+import asyncio
+import functools
+import json
+import re
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+try:
+    import orjson
+
+    def _loads(raw: bytes):
+        return orjson.loads(raw)
+
+    def _dumps_indented(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _loads(raw: bytes):
+        return json.loads(raw)
+
+    def _dumps_indented(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+
+from src.tools.github_search import aclose_client, search_github_code_async
+from src.tools.company_api import (
+    CompanyAPIError,
+    get_equipment_status,
+    get_inventory,
+    get_load_status,
+    list_equipment,
+    list_inventory,
+    list_loads,
+)
+
+# Plain test-harness log format; see test_pipeline.py
+logger.remove()
+logger.add(
+    sys.stderr,
+    format="{level: <8} | {message}",
+    level="INFO",
+    colorize=False,
+)
+
+# Cap on queries in flight at once: enough to overlap network latency,
+# low enough to stay clear of the GitHub secondary rate limit.
+MAX_CONCURRENT_QUERIES = 10
+
+
+@functools.lru_cache(maxsize=4)
+def _load_queries_cached(path: str, mtime: float) -> Dict[str, Any]:
+    """
+    Parse a query file, memoized by path and modification time.
+
+    Re-instantiating the runner (CI retries, notebook sessions) reuses
+    the parse as long as the file hasn't changed; an edit bumps the
+    mtime and misses the cache. Callers must treat the returned mapping
+    as read-only since it's shared between cache hits.
+    """
+    return _loads(Path(path).read_bytes()).get("queries", {})
+
+# One alternation pass replaces six sequential substring scans; the map
+# restores canonical casing for the matched token.
+_KW_RE = re.compile(
+    r"\b(fastapi|pipecat|pinecone|websocket|docker|pytest)\b", re.IGNORECASE
+)
+_KW_CANONICAL = {
+    "fastapi": "FastAPI",
+    "pipecat": "pipecat",
+    "pinecone": "pinecone",
+    "websocket": "websocket",
+    "docker": "docker",
+    "pytest": "pytest",
+}
+# Filler words stripped from free-form queries before picking a term
+_STRIP_RE = re.compile(r"\b(search|find|github|for)\b", re.IGNORECASE)
+
+_LOAD_ID_RE = re.compile(r"\b(\d{3,})\b")
+_SKU_RE = re.compile(r"\b(SKU-\d+)\b", re.IGNORECASE)
+_EQUIPMENT_RE = re.compile(r"\b([A-Z]+-\d+)\b")
+
+# Bulk fetcher, collection key, and id key per Company API category.
+# One list_* round trip per category replaces N single-item lookups;
+# individual queries then resolve from the in-memory snapshot.
+_SNAPSHOT_SPECS = {
+    "load_status": (list_loads, "loads", "load_id"),
+    "inventory": (list_inventory, "items", "sku"),
+    "equipment": (list_equipment, "equipment", "equipment_id"),
+}
+
+
+@dataclass(slots=True)
+class TestResult:
+    """
+    Outcome of one accuracy test query.
+
+    Slotted: a run produces one instance per query and the metrics and
+    serialization loops are dominated by attribute access, so fixed-
+    offset slot loads (and no per-instance __dict__) are worth having.
+    """
+
+    query_id: str
+    query: str
+    category: str
+    response: Optional[str] = None
+    sources: List[Dict[str, Any]] = field(default_factory=list)
+    actual_source_types: List[str] = field(default_factory=list)
+    has_source_attribution: bool = False
+    error: Optional[str] = None
+    latency_ms: float = 0.0
+    accuracy_score: Optional[int] = None
+    notes: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the result for the results/review files."""
+        # Manual dict literal: dataclasses.asdict deep-copies recursively
+        return {
+            "query_id": self.query_id,
+            "query": self.query,
+            "category": self.category,
+            "response": self.response,
+            "sources": self.sources,
+            "actual_source_types": self.actual_source_types,
+            "has_source_attribution": self.has_source_attribution,
+            "error": self.error,
+            "latency_ms": self.latency_ms,
+            "accuracy_score": self.accuracy_score,
+            "notes": self.notes,
+        }
+
+
+class AccuracyTestRunner:
+    """Runs the accuracy query suite against the live tool layer."""
+
+    def __init__(self, queries_file: Optional[str] = None):
+        """
+        Initialize the runner and load the query suite.
+
+        Args:
+            queries_file: Path to test_queries.json (defaults to the
+                copy next to this script)
+        """
+        if queries_file is None:
+            queries_file = str(Path(__file__).parent / "test_queries.json")
+        self.queries = self.load_queries(queries_file)
+        self.results: List[TestResult] = []
+        # The keyword ladder collapses queries onto a handful of search
+        # terms, so identical searches within one run resolve from this
+        # memo. The tool layer's TTL cache and in-flight coalescing
+        # already dedupe across runs; this just skips re-entering that
+        # machinery (and pins results stable for the whole run even if
+        # the TTL expires mid-pass).
+        self._github_memo: Dict[tuple, Dict[str, Any]] = {}
+        # Per-category Company API snapshots, filled by
+        # _prefetch_snapshot before a category's queries dispatch.
+        self._snapshots: Dict[str, Dict[str, Any]] = {}
+        # Queries are independent, so they dispatch concurrently under a
+        # semaphore: wall time is bounded by the slowest batch instead
+        # of the sum of every round trip.
+        self._sem = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+
+    def load_queries(self, queries_file: str) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Load the query suite from disk.
+
+        Args:
+            queries_file: Path to test_queries.json
+
+        Returns:
+            Mapping of category name to its query list
+        """
+        path = Path(queries_file)
+        return _load_queries_cached(str(path), path.stat().st_mtime)
+
+    async def run_tests(self) -> None:
+        """Run every category's queries concurrently."""
+        started = time.perf_counter()
+        for category, category_queries in self.queries.items():
+            logger.info(
+                f"Running {len(category_queries)} {category} queries..."
+            )
+            spec = _SNAPSHOT_SPECS.get(category)
+            if spec is not None:
+                await self._prefetch_snapshot(category, spec)
+            tasks = [
+                self._dispatch(category, query_info)
+                for query_info in category_queries
+            ]
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+            for query_info, outcome in zip(category_queries, outcomes):
+                if isinstance(outcome, BaseException):
+                    logger.error(
+                        f"Query {query_info['id']} raised: {outcome}"
+                    )
+        elapsed = time.perf_counter() - started
+        logger.info(f"Ran {len(self.results)} queries in {elapsed:.2f}s")
+
+    async def _dispatch(self, category: str, query_info: Dict[str, str]) -> None:
+        """Run one query under the concurrency limit and record it."""
+        result = TestResult(query_info["id"], query_info["query"], category)
+        async with self._sem:
+            start = time.perf_counter_ns()
+            try:
+                if category == "github_search":
+                    await self.test_github_search_query(result)
+                elif category == "load_status":
+                    await self.test_load_status_query(result)
+                elif category == "inventory":
+                    await self.test_inventory_query(result)
+                elif category == "equipment":
+                    await self.test_equipment_query(result)
+                else:
+                    result.error = f"Unknown category: {category}"
+            except CompanyAPIError as e:
+                result.error = str(e)
+            except Exception as e:
+                result.error = f"{type(e).__name__}: {e}"
+            result.latency_ms = (time.perf_counter_ns() - start) * 1e-6
+        self.results.append(result)
+
+    async def _prefetch_snapshot(
+        self, category: str, spec: tuple
+    ) -> None:
+        """
+        Fetch a category's full listing once and index it by id.
+
+        Collapses N single-item round trips into one bulk call: a run
+        with many load/SKU/equipment lookups pays the Company API
+        latency once per category instead of once per query. On a
+        failed bulk fetch the snapshot stays absent and the per-query
+        calls remain as the fallback path.
+        """
+        fetcher, collection_key, id_key = spec
+        try:
+            data = await asyncio.to_thread(fetcher)
+        except CompanyAPIError as e:
+            logger.warning(
+                f"Bulk {category} fetch failed, using per-query calls: {e}"
+            )
+            return
+        self._snapshots[category] = {
+            "data": data,
+            "by_id": {
+                entry[id_key]: entry
+                for entry in data.get(collection_key, [])
+                if id_key in entry
+            },
+        }
+
+    async def test_github_search_query(self, result: TestResult) -> None:
+        """Resolve a github_search query and record its attribution."""
+        match = _KW_RE.search(result.query)
+        if match:
+            search_term = _KW_CANONICAL[match.group(1).lower()]
+        else:
+            stripped = _STRIP_RE.sub("", result.query.lower()).split()
+            search_term = stripped[0] if stripped else "python"
+
+        memo_key = (search_term, "python", 3)
+        data = self._github_memo.get(memo_key)
+        if data is None:
+            data = await search_github_code_async(
+                query=search_term, language="python", max_results=3
+            )
+            self._github_memo[memo_key] = data
+        items = data.get("items", [])
+        result.response = f"Found {len(items)} results for '{search_term}'"
+        result.sources = [item.get("source", {}) for item in items]
+        self._record_attribution(result)
+
+    async def test_load_status_query(self, result: TestResult) -> None:
+        """Resolve a load_status query and record its attribution."""
+        match = _LOAD_ID_RE.search(result.query)
+        snap = self._snapshots.get("load_status")
+        if match:
+            load_id = match.group(1)
+            if snap is not None:
+                load = snap["by_id"].get(load_id)
+                if load is None:
+                    raise CompanyAPIError(f"Load not found: {load_id}")
+                data = snap["data"]
+                status = load.get("status", "unknown")
+            else:
+                data = await asyncio.to_thread(get_load_status, load_id)
+                status = data.get("status", "unknown")
+            result.response = f"Load {load_id}: {status}"
+        else:
+            if snap is not None:
+                data = snap["data"]
+            else:
+                data = await asyncio.to_thread(list_loads)
+            result.response = f"{data.get('total_count', 0)} loads"
+        result.sources = [data.get("source", {})]
+        self._record_attribution(result)
+
+    async def test_inventory_query(self, result: TestResult) -> None:
+        """Resolve an inventory query and record its attribution."""
+        match = _SKU_RE.search(result.query)
+        snap = self._snapshots.get("inventory")
+        if match:
+            sku = match.group(1).upper()
+            if snap is not None:
+                item = snap["by_id"].get(sku)
+                if item is None:
+                    raise CompanyAPIError(f"SKU not found: {sku}")
+                data = snap["data"]
+                quantity = item.get("quantity", 0)
+            else:
+                data = await asyncio.to_thread(get_inventory, sku)
+                quantity = data.get("quantity", 0)
+            result.response = f"{sku}: {quantity} units"
+        else:
+            if snap is not None:
+                data = snap["data"]
+            else:
+                data = await asyncio.to_thread(list_inventory)
+            result.response = f"{data.get('total_items', 0)} items"
+        result.sources = [data.get("source", {})]
+        self._record_attribution(result)
+
+    async def test_equipment_query(self, result: TestResult) -> None:
+        """Resolve an equipment query and record its attribution."""
+        match = _EQUIPMENT_RE.search(result.query)
+        snap = self._snapshots.get("equipment")
+        if match:
+            equipment_id = match.group(1)
+            if snap is not None:
+                equipment = snap["by_id"].get(equipment_id)
+                if equipment is None:
+                    raise CompanyAPIError(
+                        f"Equipment not found: {equipment_id}"
+                    )
+                data = snap["data"]
+                status = equipment.get("status", "unknown")
+            else:
+                data = await asyncio.to_thread(
+                    get_equipment_status, equipment_id
+                )
+                status = data.get("status", "unknown")
+            result.response = f"{equipment_id}: {status}"
+        else:
+            if snap is not None:
+                data = snap["data"]
+            else:
+                data = await asyncio.to_thread(list_equipment)
+            result.response = f"{data.get('total_count', 0)} equipment items"
+        result.sources = [data.get("source", {})]
+        self._record_attribution(result)
+
+    @staticmethod
+    def _record_attribution(result: TestResult) -> None:
+        """Derive the attribution flags from the collected sources."""
+        result.actual_source_types = [
+            source["type"] for source in result.sources if "type" in source
+        ]
+        result.has_source_attribution = bool(result.actual_source_types)
+
+    def calculate_metrics(self) -> Dict[str, Any]:
+        """
+        Aggregate run-level metrics over the collected results.
+
+        Returns:
+            dict: Grounding rate, error counts, source-type breakdown,
+            and per-category stats
+        """
+        total = len(self.results)
+        if not total:
+            return {}
+
+        # One pass over the results instead of four: every counter
+        # updates from the same traversal, so each TestResult is touched
+        # once.
+        grounded_count = 0
+        error_count = 0
+        source_type_counts: Counter = Counter()
+        category_stats: Dict[str, Dict[str, int]] = {}
+        for r in self.results:
+            grounded = r.has_source_attribution
+            failed = r.error is not None
+            grounded_count += grounded
+            error_count += failed
+            source_type_counts.update(r.actual_source_types)
+            stats = category_stats.setdefault(
+                r.category, {"total": 0, "grounded": 0, "errors": 0}
+            )
+            stats["total"] += 1
+            stats["grounded"] += grounded
+            stats["errors"] += failed
+
+        return {
+            "total_queries": total,
+            "grounded_count": grounded_count,
+            "grounding_rate": grounded_count / total * 100,
+            "error_count": error_count,
+            "source_type_counts": dict(source_type_counts),
+            "category_stats": category_stats,
+        }
+
+    def save_results(self, output_file: str) -> None:
+        """
+        Write the raw results to a JSON file.
+
+        Args:
+            output_file: Destination path
+        """
+        results_data = {
+            "metrics": self.calculate_metrics(),
+            "results": [r.to_dict() for r in self.results],
+        }
+        # One serialize, one binary write — no indent prettyprinter
+        # trickling tokens through the file object.
+        with open(output_file, "wb") as f:
+            f.write(_dumps_indented(results_data))
+        logger.info(f"Results saved to {output_file}")
+
+    def generate_review_file(self, output_file: str) -> None:
+        """
+        Write the manual-review skeleton consumed by calculate_accuracy.
+
+        Args:
+            output_file: Destination path for accuracy_review.json
+        """
+        review_data = {
+            "instructions": (
+                "Score each review 0-10 in accuracy_score, then run "
+                "calculate_accuracy.py on this file."
+            ),
+            "reviews": [r.to_dict() for r in self.results],
+        }
+        with open(output_file, "wb") as f:
+            f.write(_dumps_indented(review_data))
+        logger.info(f"Review file saved to {output_file}")
+
+
+async def main():
+    """Run the suite, print metrics, and write the output files."""
+    runner = AccuracyTestRunner()
+    # Every GitHub call in the run shares the tool layer's pooled
+    # HTTP/2 client (and the Company API calls its keep-alive pool), so
+    # TLS handshakes are paid once per host, not once per query. Close
+    # the event-loop-bound client before the loop goes away.
+    try:
+        await runner.run_tests()
+    finally:
+        await aclose_client()
+
+    metrics = runner.calculate_metrics()
+    if metrics:
+        logger.info(
+            f"Grounding rate: {metrics['grounding_rate']:.1f}% "
+            f"({metrics['grounded_count']}/{metrics['total_queries']}), "
+            f"errors: {metrics['error_count']}"
+        )
+
+    out_dir = Path(__file__).parent
+    runner.save_results(str(out_dir / "accuracy_results.json"))
+    runner.generate_review_file(str(out_dir / "accuracy_review.json"))
+    return 1 if not metrics or metrics["error_count"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
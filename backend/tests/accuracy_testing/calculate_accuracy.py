@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Compute accuracy metrics from a reviewed query file.
+
+Reads an accuracy_review.json produced by a manual or LLM review pass
+(each review carries an accuracy_score from 0-10 plus the query and its
+category), aggregates score statistics in a single pass, and writes an
+accuracy_report.json next to the input.
+"""
+import heapq
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import orjson
+
+    def _loads(raw: bytes):
+        return orjson.loads(raw)
+
+    def _dumps_indented(obj) -> str:
+        # OPT_NON_STR_KEYS keeps the int-keyed score_distribution intact
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+except ImportError:
+    def _loads(raw: bytes):
+        return json.loads(raw)
+
+    def _dumps_indented(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+try:
+    import ijson
+
+    def _iter_reviews(review_file: str):
+        """Stream review objects without materializing the whole file."""
+        with open(review_file, "rb") as f:
+            yield from ijson.items(f, "reviews.item")
+
+except ImportError:
+    def _iter_reviews(review_file: str):
+        """Fallback: parse the whole file when ijson is unavailable."""
+        with open(review_file, "rb") as f:
+            yield from _loads(f.read()).get("reviews", [])
+
+
+# How many of the worst-scoring queries the report surfaces
+_TOP_PROBLEMATIC = 10
+
+
+def calculate_accuracy_from_reviews(review_file: str) -> dict:
+    """
+    Aggregate accuracy metrics from a review file.
+
+    Reviews stream through one pass (via ijson when installed) that
+    retains only compact data — score ints, category strings, and
+    problematic-query entries — so peak memory no longer scales with
+    full review dicts. Score statistics are computed over a packed int8
+    numpy array: bincount gives the whole distribution in one C-level
+    sweep and the reductions (sum/min/max/median) run vectorized
+    instead of through per-element Python bytecode. Category counts and
+    totals come from two bincounts over the inverse of np.unique.
+
+    Args:
+        review_file: Path to the accuracy_review.json file
+
+    Returns:
+        dict: Aggregated metrics, empty when no scored reviews exist
+    """
+    scores_list = []
+    categories = []
+    # The report only ever shows the ten worst queries, so keep a
+    # bounded heap of those plus a plain counter instead of
+    # materializing every sub-8 entry.
+    problematic_count = 0
+    worst_heap = []
+    for index, review in enumerate(_iter_reviews(review_file)):
+        score = review.get("accuracy_score")
+        if score is None:
+            continue
+        scores_list.append(score)
+        category = review.get("category", "uncategorized")
+        categories.append(category)
+        if score < 8:
+            problematic_count += 1
+            entry = {
+                "query": review.get("query", ""),
+                "category": category,
+                "score": score,
+                "notes": review.get("notes", ""),
+            }
+            # Negated score makes the heap root the best of the kept
+            # entries, i.e. the one to evict; index breaks score ties.
+            heapq.heappush(worst_heap, (-score, -index, entry))
+            if len(worst_heap) > _TOP_PROBLEMATIC:
+                heapq.heappop(worst_heap)
+
+    if not scores_list:
+        return {}
+
+    total_scored = len(scores_list)
+    scores_np = np.asarray(scores_list, dtype=np.int8)
+    dist_np = np.bincount(scores_np, minlength=11)
+    # tolist() converts to native ints in one C call; indexing the array
+    # per bucket would box a numpy scalar each time.
+    dist = dict(enumerate(dist_np.tolist()))
+    total_score = int(scores_np.sum())
+    min_score = int(scores_np.min())
+    max_score = int(scores_np.max())
+    median_score = float(np.median(scores_np))
+
+    perfect_count = int(dist_np[10])
+    good_count = int(dist_np[8:11].sum())
+    acceptable_count = int(dist_np[6:8].sum())
+    poor_count = int(dist_np[0:6].sum())
+
+    # Per-category counts and totals: group once with np.unique, then
+    # two bincounts over the inverse indices.
+    cat_names, cat_inverse = np.unique(categories, return_inverse=True)
+    cat_counts = np.bincount(cat_inverse)
+    cat_totals = np.bincount(cat_inverse, weights=scores_np)
+    # Only count/total/average are ever read downstream; per-category
+    # score lists would just be allocated and thrown away.
+    category_stats = {
+        str(name): {
+            "count": int(count),
+            "total_score": int(total),
+            "average_score": float(total / count),
+        }
+        for name, count, total in zip(cat_names, cat_counts, cat_totals)
+    }
+
+    # The empty case already returned above, so total_scored > 0 here;
+    # one reciprocal replaces the repeated guarded divisions.
+    inv_total_pct = 100.0 / total_scored
+
+    return {
+        "total_scored": total_scored,
+        "accuracy_percentage": total_score * inv_total_pct / 10,
+        "average_score": total_score / total_scored,
+        "median_score": median_score,
+        "min_score": min_score,
+        "max_score": max_score,
+        "score_distribution": dist,
+        "perfect_count": perfect_count,
+        "perfect_percentage": perfect_count * inv_total_pct,
+        "good_count": good_count,
+        "good_percentage": good_count * inv_total_pct,
+        "acceptable_count": acceptable_count,
+        "acceptable_percentage": acceptable_count * inv_total_pct,
+        "poor_count": poor_count,
+        "poor_percentage": poor_count * inv_total_pct,
+        "category_stats": category_stats,
+        "problematic_count": problematic_count,
+        "problematic_queries_top10": [
+            entry for _, _, entry in sorted(worst_heap, reverse=True)
+        ],
+    }
+
+
+def print_accuracy_report(metrics: dict) -> None:
+    """
+    Print a human-readable accuracy report to stdout.
+
+    Args:
+        metrics: Output of calculate_accuracy_from_reviews
+    """
+    if not metrics:
+        sys.stdout.write("No scored reviews found.\n")
+        return
+
+    # Assemble the whole report and emit it in one write: each print()
+    # takes the stdio lock and, on line-buffered streams, a syscall.
+    rule = "=" * 60
+    out = [
+        rule,
+        "Accuracy Report",
+        rule,
+        "",
+        f"Total scored queries: {metrics['total_scored']}",
+        f"Accuracy: {metrics['accuracy_percentage']:.1f}%",
+        f"Average score: {metrics['average_score']:.2f}/10",
+        f"Median score: {metrics['median_score']}",
+        f"Score range: {metrics['min_score']}-{metrics['max_score']}",
+        "",
+        "Score buckets:",
+        f"  Perfect (10):    {metrics['perfect_count']} "
+        f"({metrics['perfect_percentage']:.1f}%)",
+        f"  Good (8-10):     {metrics['good_count']} "
+        f"({metrics['good_percentage']:.1f}%)",
+        f"  Acceptable (6-7): {metrics['acceptable_count']} "
+        f"({metrics['acceptable_percentage']:.1f}%)",
+        f"  Poor (<6):       {metrics['poor_count']} "
+        f"({metrics['poor_percentage']:.1f}%)",
+        "",
+        "By category:",
+    ]
+    out.extend(
+        f"  {category}: {stats['average_score']:.2f}/10 "
+        f"({stats['count']} queries)"
+        for category, stats in sorted(metrics["category_stats"].items())
+    )
+    out.append("")
+
+    problematic_count = metrics["problematic_count"]
+    if problematic_count:
+        out.append(f"Problematic queries (score < 8): {problematic_count}")
+        worst = metrics["problematic_queries_top10"]
+        out.extend(
+            f"  [{entry['score']}] ({entry['category']}) {entry['query']}"
+            for entry in worst
+        )
+        if problematic_count > len(worst):
+            out.append(f"  ... and {problematic_count - len(worst)} more")
+    else:
+        out.append("No problematic queries.")
+    out.append(rule)
+
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def save_accuracy_report(metrics: dict, output_file: str) -> None:
+    """
+    Write the metrics report to a JSON file.
+
+    Args:
+        metrics: Output of calculate_accuracy_from_reviews
+        output_file: Destination path for accuracy_report.json
+    """
+    # Serialize once and write once: json.dump with indent streams many
+    # small writes through the file object, one per token.
+    payload = _dumps_indented(metrics)
+    with open(output_file, "w") as f:
+        f.write(payload)
+    print(f"Report saved to {output_file}")
+
+
+def main():
+    """Entry point: calculate, print, and save the accuracy report."""
+    review_file = sys.argv[1] if len(sys.argv) > 1 else str(
+        Path(__file__).parent / "accuracy_review.json"
+    )
+    if not Path(review_file).exists():
+        print(f"Review file not found: {review_file}")
+        sys.exit(1)
+
+    metrics = calculate_accuracy_from_reviews(review_file)
+    print_accuracy_report(metrics)
+    save_accuracy_report(
+        metrics, str(Path(review_file).parent / "accuracy_report.json")
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Locust load test for the Company API.
+
+Simulates warehouse users hammering the load/inventory/equipment
+endpoints and reports latency percentiles at test stop. Run against the
+mock API with:
+
+    locust -f load_test.py --host http://localhost:8000
+"""
+import array
+import itertools
+import sys
+
+import numpy as np
+from locust import between, events, task
+from locust.contrib.fasthttp import FastHttpUser
+
+# Successful request latencies (ms) land in a preallocated float array:
+# every greenlet's listener call is a single store at the next counter
+# slot, with no shared-list reallocation skewing the measurement.
+# itertools.count is a C-level iterator, so next() is effectively atomic
+# under the GIL.
+_MAX_SAMPLES = 2_000_000
+_latency_buf = array.array("f", bytes(4 * _MAX_SAMPLES))
+_latency_idx = itertools.count()
+
+# random.choice costs a Python-level RNG call plus bounds checks per
+# task; at thousands of tasks per second that overhead lands inside the
+# measured loop. Each user instead draws from a pregenerated block of
+# indexes — one vectorized randint call per 100k picks.
+_INDEX_BLOCK = 100_000
+
+
+def _index_stream(n_options: int):
+    """Endless iterator of random indexes in [0, n_options)."""
+    while True:
+        yield from np.random.randint(0, n_options, size=_INDEX_BLOCK).tolist()
+
+
+@events.request.add_listener
+def track_latency(request_type, name, response_time, response_length,
+                  exception, **kwargs):
+    """Record the latency of every successful request."""
+    if exception is None:
+        i = next(_latency_idx)
+        if i < _MAX_SAMPLES:
+            _latency_buf[i] = response_time
+
+
+@events.test_stop.add_listener
+def on_test_stop(environment, **kwargs):
+    """Summarize latency percentiles over the whole run."""
+    count = min(next(_latency_idx), _MAX_SAMPLES)
+    if not count:
+        sys.stdout.write("No successful requests recorded.\n")
+        return
+
+    # Zero-copy view over the preallocated buffer; introselect pulls
+    # the percentiles in O(N) without sorting boxed floats.
+    arr = np.frombuffer(_latency_buf, dtype=np.float32, count=count)
+    p90, p95, p99 = np.percentile(arr, [90, 95, 99], method="lower")
+    sys.stdout.write(
+        f"\n===== Latency Summary ({count} requests) =====\n"
+        f"mean: {arr.mean():.1f}ms  min: {arr.min():.1f}ms  "
+        f"max: {arr.max():.1f}ms\n"
+        f"p90: {p90:.1f}ms  p95: {p95:.1f}ms  p99: {p99:.1f}ms\n"
+    )
+
+
+class JarvisUser(FastHttpUser):
+    """Virtual user exercising the Company API endpoints.
+
+    FastHttpUser (geventhttpclient) keeps one persistent connection per
+    user and skips the requests.Session machinery, so per-user CPU stays
+    out of the latency measurement at high user counts.
+    """
+
+    wait_time = between(0.5, 2.0)
+
+    load_ids = ["2314", "2315", "2316"]
+    skus = ["SKU-001", "SKU-002", "SKU-003"]
+    equipment_ids = ["FORK-001", "FORK-002"]
+
+    def on_start(self):
+        """Precompute the random index streams for this user."""
+        self._load_idx = _index_stream(len(self.load_ids))
+        self._sku_idx = _index_stream(len(self.skus))
+        self._equipment_idx = _index_stream(len(self.equipment_ids))
+
+    @task(3)
+    def get_load_status(self):
+        """Fetch one load's status."""
+        load_id = self.load_ids[next(self._load_idx)]
+        self.client.get(
+            f"/api/v1/loads/{load_id}", name="/api/v1/loads/[id]"
+        )
+
+    @task(2)
+    def get_inventory(self):
+        """Fetch one SKU's inventory."""
+        sku = self.skus[next(self._sku_idx)]
+        self.client.get(
+            f"/api/v1/inventory/{sku}", name="/api/v1/inventory/[sku]"
+        )
+
+    @task(2)
+    def get_equipment_status(self):
+        """Fetch one piece of equipment."""
+        equipment_id = self.equipment_ids[next(self._equipment_idx)]
+        self.client.get(
+            f"/api/v1/equipment/{equipment_id}",
+            name="/api/v1/equipment/[id]",
+        )
+
+    @task(1)
+    def list_loads(self):
+        """List every load."""
+        self.client.get("/api/v1/loads")